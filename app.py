@@ -3,23 +3,22 @@ import streamlit as st
 import os
 import json
 import csv
-from io import StringIO
+import functools
+from bisect import insort
+from itertools import chain
 from pathlib import Path
 from datetime import datetime
+from typing import TYPE_CHECKING
 from dotenv import load_dotenv
 
-# Core imports (always available)
-from src.generator.bio_generator import BioGenerator
-from src.sheets.sheets_writer import SheetsWriter
-from src.models.data_models import Therapist, Specialty, GeneratedBio
 from src.utils.logger import setup_logger
 
-# Optional scraping imports (only needed for WIP scraping feature)
-try:
-    from src.scraper.website_scraper import WebsiteScraper
-    SCRAPING_AVAILABLE = True
-except ImportError:
-    SCRAPING_AVAILABLE = False
+# Heavy imports (anthropic, gspread, scraping stack) are deferred until first use
+if TYPE_CHECKING:
+    from src.generator.bio_generator import BioGenerator
+    from src.models.data_models import GeneratedBio
+
+_bio_generator_cls = None
 
 # Load environment variables from .env file
 load_dotenv()
@@ -39,6 +38,14 @@ def initialize_session_state():
     """Initialize session state variables."""
     if 'accumulated_bios' not in st.session_state:
         st.session_state.accumulated_bios = []
+    if 'bios_by_specialty' not in st.session_state:
+        st.session_state.bios_by_specialty = {}
+    if 'sorted_specialty_names' not in st.session_state:
+        st.session_state.sorted_specialty_names = []
+    if 'bios_version' not in st.session_state:
+        st.session_state.bios_version = 0
+    if 'csv_cache' not in st.session_state:
+        st.session_state.csv_cache = None
     if 'therapist_about_text' not in st.session_state:
         st.session_state.therapist_about_text = ""
     if 'therapist_name' not in st.session_state:
@@ -47,32 +54,41 @@ def initialize_session_state():
         st.session_state.modalities_text = ""
     if 'total_tokens_used' not in st.session_state:
         st.session_state.total_tokens_used = 0
+    if 'total_cost' not in st.session_state:
+        st.session_state.total_cost = 0.0
     if 'specialty_content' not in st.session_state:
         st.session_state.specialty_content = ""
     if 'specialty_bio_text' not in st.session_state:
         st.session_state.specialty_bio_text = ""
 
 
-def get_api_keys():
-    """Get API keys from environment, Streamlit secrets, or user input."""
-    anthropic_key = None
-    google_creds = None
+@functools.lru_cache(maxsize=4)
+def _parse_creds_json(creds_text: str) -> dict:
+    """Parse a credentials JSON string, memoized so the same text is only parsed once."""
+    return json.loads(creds_text)
 
-    # Try to get from environment variables first (local development)
-    anthropic_key = os.getenv("ANTHROPIC_API_KEY")
 
-    # Try to load Google credentials from file or JSON string
-    creds_file = os.getenv("GOOGLE_SHEETS_CREDENTIALS_FILE")
-    creds_json = os.getenv("GOOGLE_SHEETS_CREDENTIALS")
+@st.cache_resource(show_spinner=False)
+def _load_keys_from_env_and_secrets(anthropic_env_key, creds_file, creds_file_mtime, creds_json):
+    """
+    Load API keys from environment values and Streamlit secrets.
 
-    if creds_file and Path(creds_file).exists():
+    Cached across reruns; the environment values (and the credentials file's
+    modification time) are passed in as arguments so the cache is keyed on
+    them and refreshes if they change.
+    """
+    anthropic_key = anthropic_env_key
+    google_creds = None
+
+    # Try to load Google credentials from file or JSON string
+    if creds_file_mtime is not None:
         # Load from file
         with open(creds_file, 'r') as f:
             google_creds = json.load(f)
     elif creds_json:
         # Load from JSON string
         try:
-            google_creds = json.loads(creds_json)
+            google_creds = _parse_creds_json(creds_json)
         except:
             pass
 
@@ -89,6 +105,41 @@ def get_api_keys():
         except:
             pass
 
+    return anthropic_key, google_creds
+
+
+def add_bio_to_session(bio):
+    """Append a bio to the session, keeping the by-specialty grouping in sync."""
+    st.session_state.accumulated_bios.append(bio)
+
+    specialty_bios = st.session_state.bios_by_specialty.setdefault(bio.specialty_name, [])
+    if not specialty_bios:
+        insort(st.session_state.sorted_specialty_names, bio.specialty_name)
+    specialty_bios.append(bio)
+    st.session_state.bios_version += 1
+
+
+def iter_session_bios_by_specialty():
+    """Iterate accumulated bios in specialty order using the session's grouping."""
+    return chain.from_iterable(
+        st.session_state.bios_by_specialty[specialty_name]
+        for specialty_name in st.session_state.sorted_specialty_names
+    )
+
+
+def get_api_keys():
+    """Get API keys from environment, Streamlit secrets, or user input."""
+    # Environment variables (local development) and secrets (deployment) are cached
+    creds_file = os.getenv("GOOGLE_SHEETS_CREDENTIALS_FILE")
+    creds_file_mtime = os.path.getmtime(creds_file) if creds_file and Path(creds_file).exists() else None
+
+    anthropic_key, google_creds = _load_keys_from_env_and_secrets(
+        os.getenv("ANTHROPIC_API_KEY"),
+        creds_file,
+        creds_file_mtime,
+        os.getenv("GOOGLE_SHEETS_CREDENTIALS")
+    )
+
     # If not found anywhere, get from user input
     if not anthropic_key:
         st.sidebar.subheader("API Configuration")
@@ -107,7 +158,7 @@ def get_api_keys():
 
         if google_creds_text:
             try:
-                google_creds = json.loads(google_creds_text)
+                google_creds = _parse_creds_json(google_creds_text)
             except:
                 st.sidebar.error("Invalid JSON format")
                 google_creds = None
@@ -115,42 +166,73 @@ def get_api_keys():
     return anthropic_key, google_creds
 
 
-def bios_to_csv(bios):
-    """Convert bios to CSV format."""
-    output = StringIO()
-    writer = csv.writer(output)
+class _Echo:
+    """File-like object whose write() returns the value instead of storing it."""
 
-    # Write header
-    writer.writerow(['Specialty', 'Therapist Name', 'Bio Box (110 words)', 'Source About URL'])
+    def write(self, value):
+        return value
+
+
+def iter_bio_csv(bios):
+    """Yield CSV text one row at a time, in the order given (pass bios grouped by specialty)."""
+    writer = csv.writer(_Echo())
+
+    # Header row
+    yield writer.writerow(['Specialty', 'Therapist Name', 'Bio Box (110 words)', 'Source About URL'])
 
-    # Group by specialty and write rows
-    bios_by_specialty = {}
     for bio in bios:
-        if bio.specialty_name not in bios_by_specialty:
-            bios_by_specialty[bio.specialty_name] = []
-        bios_by_specialty[bio.specialty_name].append(bio)
+        yield writer.writerow([
+            bio.specialty_name,
+            bio.therapist_name,
+            bio.bio_text,
+            str(bio.source_about_url)
+        ])
 
-    for specialty_name in sorted(bios_by_specialty.keys()):
-        specialty_bios = bios_by_specialty[specialty_name]
-        for bio in specialty_bios:
-            writer.writerow([
-                specialty_name,
-                bio.therapist_name,
-                bio.bio_text,
-                str(bio.source_about_url)
-            ])
 
-    return output.getvalue()
+def bios_to_csv(bios):
+    """Convert bios to CSV format."""
+    return "".join(iter_bio_csv(bios))
+
+
+def session_bios_csv():
+    """Return the session's bios as CSV, rebuilding it only when the bios have changed."""
+    cached = st.session_state.csv_cache
+    if cached is None or cached[0] != st.session_state.bios_version:
+        cached = (st.session_state.bios_version, bios_to_csv(iter_session_bios_by_specialty()))
+        st.session_state.csv_cache = cached
+    return cached[1]
 
 
 def extract_specialty_name(content: str) -> str:
     """Extract specialty name from the first line of pasted content."""
-    lines = [line.strip() for line in content.split('\n') if line.strip()]
-    if lines:
-        return lines[0]
+    # Scan line by line until the first non-blank one, without splitting the whole text
+    start = 0
+    while start < len(content):
+        end = content.find('\n', start)
+        if end == -1:
+            end = len(content)
+        line = content[start:end].strip()
+        if line:
+            return line
+        start = end + 1
     return "Unknown Specialty"
 
 
+def _get_bio_generator_cls():
+    """Import BioGenerator on first use so cold starts don't pay for the anthropic import."""
+    global _bio_generator_cls
+    if _bio_generator_cls is None:
+        from src.generator.bio_generator import BioGenerator
+        _bio_generator_cls = BioGenerator
+    return _bio_generator_cls
+
+
+@st.cache_resource(show_spinner=False)
+def get_bio_generator(api_key: str) -> "BioGenerator":
+    """Get a BioGenerator (and its Anthropic HTTP client) shared across reruns for this API key."""
+    return _get_bio_generator_cls()(api_key)
+
+
 def generate_single_bio_from_manual_input(
     therapist_about: str,
     therapist_name: str,
@@ -158,7 +240,7 @@ def generate_single_bio_from_manual_input(
     specialty_content: str,
     specialty_bio_text: str,
     api_key: str
-) -> GeneratedBio:
+) -> "GeneratedBio":
     """Generate a single bio from manual input.
 
     Args:
@@ -169,6 +251,7 @@ def generate_single_bio_from_manual_input(
         specialty_bio_text: Optional specialty-specific bio text from the specialty page
         api_key: Anthropic API key
     """
+    from src.models.data_models import Therapist, Specialty
 
     # Extract specialty name from first line
     specialty_name = extract_specialty_name(specialty_content)
@@ -177,11 +260,15 @@ def generate_single_bio_from_manual_input(
     final_name = therapist_name.strip() if therapist_name.strip() else "Therapist"
 
     # Combine main bio with modalities and specialty-specific bio if provided
-    combined_bio = therapist_about
-    if modalities_text and modalities_text.strip():
-        combined_bio = f"{therapist_about}\n\n**Therapeutic Modalities:**\n{modalities_text.strip()}"
-    if specialty_bio_text and specialty_bio_text.strip():
-        combined_bio = f"{combined_bio}\n\n**Specialty-Specific Bio:**\n{specialty_bio_text.strip()}"
+    modalities = modalities_text.strip() if modalities_text else ""
+    specialty_bio = specialty_bio_text.strip() if specialty_bio_text else ""
+
+    parts = [therapist_about]
+    if modalities:
+        parts.append(f"**Therapeutic Modalities:**\n{modalities}")
+    if specialty_bio:
+        parts.append(f"**Specialty-Specific Bio:**\n{specialty_bio}")
+    combined_bio = "\n\n".join(parts)
 
     # Create Therapist object
     therapist = Therapist(
@@ -198,14 +285,17 @@ def generate_single_bio_from_manual_input(
         url="http://manual-entry.local"
     )
 
-    # Initialize generator
-    generator = BioGenerator(api_key)
+    # Reuse the cached generator
+    generator = get_bio_generator(api_key)
 
-    # Generate bio
-    bio = generator._generate_single_bio(therapist, specialty)
+    # Generate bio, collecting this call's token usage (the generator and its
+    # running total are shared with every other session)
+    usage_log = []
+    bio = generator._generate_single_bio(therapist, specialty, usage_log)
 
-    # Track tokens
-    st.session_state.total_tokens_used += generator.total_tokens_used
+    # Track tokens and cost
+    st.session_state.total_tokens_used += sum(tokens for tokens, _ in usage_log)
+    st.session_state.total_cost += sum(cost for _, cost in usage_log)
 
     return bio
 
@@ -353,7 +443,7 @@ def render_manual_entry_tab(anthropic_key, google_creds):
                 )
 
                 # Add to accumulated bios
-                st.session_state.accumulated_bios.append(bio)
+                add_bio_to_session(bio)
 
                 # Clear specialty fields for next generation
                 st.session_state.specialty_content = ""
@@ -367,7 +457,7 @@ def render_manual_entry_tab(anthropic_key, google_creds):
                 st.rerun()
 
             except Exception as e:
-                logger.exception(f"Error generating bio: {str(e)}")
+                logger.exception("Error generating bio: %s", e)
                 st.error(f"❌ Error generating bio: {str(e)}")
                 with st.expander("Error Details"):
                     import traceback
@@ -379,22 +469,13 @@ def render_manual_entry_tab(anthropic_key, google_creds):
     if st.session_state.accumulated_bios:
         st.subheader(f"📋 Generated Bios ({len(st.session_state.accumulated_bios)})")
 
-        # Group by specialty
-        bios_by_specialty = {}
-        for bio in st.session_state.accumulated_bios:
-            if bio.specialty_name not in bios_by_specialty:
-                bios_by_specialty[bio.specialty_name] = []
-            bios_by_specialty[bio.specialty_name].append(bio)
-
-        # Display each specialty group
-        for specialty_name in sorted(bios_by_specialty.keys()):
+        # Display each specialty group (grouping is maintained incrementally in session state)
+        bios_by_specialty = st.session_state.bios_by_specialty
+        for specialty_name in st.session_state.sorted_specialty_names:
             with st.expander(f"**{specialty_name}** ({len(bios_by_specialty[specialty_name])} bio(s))", expanded=True):
                 for bio in bios_by_specialty[specialty_name]:
-                    # Calculate word count
-                    word_count = len(bio.bio_text.split())
-
                     # Display bio
-                    st.markdown(f"**{bio.therapist_name}** | {word_count} words")
+                    st.markdown(f"**{bio.therapist_name}** | {bio.word_count} words")
                     st.write(bio.bio_text)
                     st.divider()
 
@@ -407,7 +488,8 @@ def render_manual_entry_tab(anthropic_key, google_creds):
 
         with col1:
             # CSV Export
-            csv_data = bios_to_csv(st.session_state.accumulated_bios)
+            # Cached per bios version, so reruns that don't add bios skip the rebuild
+            csv_data = session_bios_csv()
             st.download_button(
                 label="📥 Download as CSV",
                 data=csv_data,
@@ -422,6 +504,7 @@ def render_manual_entry_tab(anthropic_key, google_creds):
                 if st.button("📊 Export to Google Sheets", use_container_width=True):
                     with st.spinner("Exporting to Google Sheets..."):
                         try:
+                            from src.sheets.sheets_writer import SheetsWriter
                             writer = SheetsWriter(credentials_dict=google_creds)
                             sheet_url = writer.write_bios(
                                 st.session_state.accumulated_bios,
@@ -434,7 +517,7 @@ def render_manual_entry_tab(anthropic_key, google_creds):
                             else:
                                 st.error("❌ Failed to export to Google Sheets")
                         except Exception as e:
-                            logger.exception(f"Error exporting to Google Sheets: {str(e)}")
+                            logger.exception("Error exporting to Google Sheets: %s", e)
                             st.error(f"❌ Error: {str(e)}")
             else:
                 st.button("📊 Export to Google Sheets", disabled=True, use_container_width=True, help="Google credentials required")
@@ -443,7 +526,12 @@ def render_manual_entry_tab(anthropic_key, google_creds):
             # Start New Session
             if st.button("🔄 Start New Session", type="secondary", use_container_width=True):
                 st.session_state.accumulated_bios = []
+                st.session_state.bios_by_specialty = {}
+                st.session_state.sorted_specialty_names = []
+                st.session_state.bios_version += 1
+                st.session_state.csv_cache = None
                 st.session_state.total_tokens_used = 0
+                st.session_state.total_cost = 0.0
                 st.session_state.specialty_content = ""
                 st.session_state.specialty_bio_text = ""
                 st.session_state.modalities_text = ""
@@ -452,8 +540,10 @@ def render_manual_entry_tab(anthropic_key, google_creds):
 
         # Show token usage and cost
         if st.session_state.total_tokens_used > 0:
-            cost = st.session_state.total_tokens_used * 0.000009
-            st.info(f"💰 Total tokens used: {st.session_state.total_tokens_used:,} | Estimated cost: ${cost:.4f}")
+            st.info(
+                f"💰 Total tokens used: {st.session_state.total_tokens_used:,} | "
+                f"Estimated cost: ${st.session_state.total_cost:.4f}"
+            )
 
         st.caption("💡 Tip: Export your bios before refreshing the page to avoid losing your work!")
 
@@ -0,0 +1,72 @@
+"""On-disk cache of generated bios."""
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_CACHE_DIR = ".bio_cache"
+
+
+class BioCache:
+    """Content-addressed store mapping a request's parameters to the bio it produced."""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding one JSON file per cached bio
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(params: dict) -> str:
+        """
+        Hash request parameters into a cache key.
+
+        Args:
+            params: Messages API parameters (model, system prompt, messages, sampling settings)
+
+        Returns:
+            SHA-256 hex digest of the parameters
+        """
+        payload = json.dumps(params, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached bio.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached bio text, or None on a miss
+        """
+        try:
+            with open(self.cache_dir / f"{key}.json", encoding="utf-8") as f:
+                return json.load(f)["bio_text"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def set(self, key: str, bio_text: str):
+        """
+        Store a bio under a cache key.
+
+        Args:
+            key: Cache key from make_key
+            bio_text: Generated bio text
+        """
+        # Write to a temp file and rename so concurrent readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"bio_text": bio_text}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_dir / f"{key}.json")
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
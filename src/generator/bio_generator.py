@@ -1,13 +1,74 @@
 """Bio generation using Claude API."""
+import asyncio
+import json
 import time
 import logging
-from typing import List, Optional, Callable
-from anthropic import Anthropic
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Callable, Tuple
+import httpx
+from anthropic import Anthropic, DefaultHttpxClient, RateLimitError
 from ..models.data_models import Therapist, Specialty, GeneratedBio
-from .prompts import SYSTEM_PROMPT, create_bio_prompt, create_fallback_bio_prompt
+from .bio_cache import DEFAULT_CACHE_DIR, BioCache
+from .prompts import (
+    BIO_SYSTEM_PROMPT,
+    create_bio_prompt,
+    create_bio_prompt_batch,
+    create_fallback_bio_prompt,
+    create_revision_prompt
+)
 
 logger = logging.getLogger("bio_generator")
 
+# Claude Sonnet 4.5 pricing: $3 per million input tokens, $15 per million output tokens
+# Average: ~$9 per million tokens, used for up-front estimates
+COST_PER_TOKEN = 9e-6
+
+# Per-token prices for billing actual usage. Prompt cache reads cost 0.1x the input
+# price and cache writes 1.25x, so cached tokens are priced separately
+INPUT_COST_PER_TOKEN = 3e-6
+OUTPUT_COST_PER_TOKEN = 15e-6
+CACHE_READ_COST_PER_TOKEN = INPUT_COST_PER_TOKEN * 0.1
+CACHE_WRITE_COST_PER_TOKEN = INPUT_COST_PER_TOKEN * 1.25
+# Message Batches requests are billed at half the real-time price
+BATCH_PRICE_MULTIPLIER = 0.5
+
+# Rough estimate: ~5000 tokens per bio (input + output)
+EST_TOKENS_PER_BIO = 5000
+
+# Prompt caching marker for static prefixes (system prompt, per-therapist block)
+CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def _retry_after_seconds(error: RateLimitError, default: float = 1.0) -> float:
+    """Read the Retry-After header from a 429 response, falling back to a default delay."""
+    try:
+        return float(error.response.headers.get("retry-after", default))
+    except (AttributeError, TypeError, ValueError):
+        return default
+
+
+class _RateLimiter:
+    """Thread-safe limiter that spaces request starts to stay under a requests-per-minute budget."""
+
+    def __init__(self, requests_per_minute: int):
+        self.interval = 60.0 / requests_per_minute if requests_per_minute > 0 else 0.0
+        self.next_slot = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until the next request slot is available."""
+        if not self.interval:
+            return
+
+        with self.lock:
+            now = time.monotonic()
+            wait = self.next_slot - now
+            self.next_slot = max(now, self.next_slot) + self.interval
+
+        if wait > 0:
+            time.sleep(wait)
+
 
 class BioGenerator:
     """Generates specialty-specific bios using Claude API."""
@@ -18,7 +79,14 @@ class BioGenerator:
         model: str = "claude-sonnet-4-5",
         max_tokens: int = 300,
         temperature: float = 0.7,
-        progress_callback: Optional[Callable[[str], None]] = None
+        progress_callback: Optional[Callable[[str], None]] = None,
+        use_batch_api: bool = True,
+        batch_max_wait: float = 10 * 60,
+        max_workers: int = 8,
+        requests_per_minute: int = 50,
+        specialties_per_call: int = 1,
+        enable_cache: bool = False,
+        cache_dir: str = DEFAULT_CACHE_DIR
     ):
         """
         Initialize the bio generator.
@@ -29,13 +97,36 @@ class BioGenerator:
             max_tokens: Maximum tokens for generation
             temperature: Temperature for generation (0.0-1.0)
             progress_callback: Optional callback for progress updates
+            use_batch_api: Submit generate_bios jobs through the Message Batches API
+            batch_max_wait: Seconds to wait for a message batch before canceling it and
+                generating the bios with real-time requests instead
+            max_workers: Maximum concurrent requests for real-time generation
+            requests_per_minute: Request budget for real-time generation (0 disables pacing)
+            specialties_per_call: When above 1 (and use_batch_api is off), generate up to this
+                many of a therapist's specialties per real-time request; 5-8 is a good range
+            enable_cache: Reuse bios previously generated from identical requests
+            cache_dir: Directory for the on-disk bio cache
         """
-        self.client = Anthropic(api_key=api_key)
+        # Keep TLS connections alive between generations so reused generators skip the handshake
+        self.client = Anthropic(
+            api_key=api_key,
+            http_client=DefaultHttpxClient(
+                limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60)
+            )
+        )
         self.model = model
         self.max_tokens = max_tokens
         self.temperature = temperature
         self.progress_callback = progress_callback
+        self.use_batch_api = use_batch_api
+        self.batch_max_wait = batch_max_wait
+        self.max_workers = max_workers
+        self.specialties_per_call = specialties_per_call
+        self.cache = BioCache(cache_dir) if enable_cache else None
         self.total_tokens_used = 0
+        self.total_cost = 0.0
+        self._usage_lock = threading.Lock()
+        self._rate_limiter = _RateLimiter(requests_per_minute)
 
     def _log(self, message: str):
         """Log a progress message."""
@@ -52,7 +143,12 @@ class BioGenerator:
         """
         Generate bios for all therapist-specialty combinations.
 
-        Processes one therapist at a time to manage context better for group practices.
+        By default every combination is submitted as a single Message Batches request.
+        Otherwise, with specialties_per_call above 1, each therapist's specialties are
+        generated a group at a time. Combinations either path doesn't produce are retried
+        with one real-time request each; real-time requests run concurrently on a
+        bounded thread pool. With the cache enabled, combinations whose request was
+        already answered are served from disk.
 
         Args:
             therapists: List of therapists
@@ -61,61 +157,369 @@ class BioGenerator:
         Returns:
             List of GeneratedBio objects
         """
-        generated_bios = []
         total_combinations = len(therapists) * len(specialties)
 
         self._log(f"Generating {total_combinations} bio(s) for {len(therapists)} therapist(s)...")
 
-        # Process one therapist at a time (better for group practices)
-        for therapist_idx, therapist in enumerate(therapists, 1):
-            # Show which therapist we're processing
-            if len(therapists) > 1:
-                self._log(f"\n--- Processing Therapist {therapist_idx}/{len(therapists)}: {therapist.name} ---")
+        # Key every therapist-specialty combination by a batch-safe custom_id
+        combinations = {}
+        for therapist_idx, therapist in enumerate(therapists):
+            for specialty_idx, specialty in enumerate(specialties):
+                combinations[f"{therapist_idx}-{specialty_idx}"] = (therapist, specialty)
 
-            # Generate all specialties for this therapist
-            for specialty_idx, specialty in enumerate(specialties, 1):
-                overall_progress = (therapist_idx - 1) * len(specialties) + specialty_idx
+        bios_by_id = {}
+        if self.cache is not None:
+            for custom_id, (therapist, specialty) in combinations.items():
+                bio = self._get_cached_bio(therapist, specialty, self._build_request_params(therapist, specialty))
+                if bio:
+                    bios_by_id[custom_id] = bio
+            if bios_by_id:
+                self._log(f"Using {len(bios_by_id)} cached bio(s)")
+
+        uncached = {
+            custom_id: pair for custom_id, pair in combinations.items()
+            if custom_id not in bios_by_id
+        }
+
+        grouped = not self.use_batch_api and self.specialties_per_call > 1
+        new_bios = {}
+        if self.use_batch_api and uncached:
+            new_bios = self._generate_with_batch(uncached)
+        elif grouped and uncached:
+            new_bios = self._generate_grouped(uncached)
+
+        for custom_id, bio in new_bios.items():
+            self._cache_bio(self._build_request_params(*combinations[custom_id]), bio)
+        bios_by_id.update(new_bios)
+
+        pending = {
+            custom_id: pair for custom_id, pair in combinations.items()
+            if custom_id not in bios_by_id
+        }
+        if pending:
+            if self.use_batch_api or grouped:
+                self._log(f"Retrying {len(pending)} bio(s) individually...")
+            bios_by_id.update(self._generate_concurrently(pending))
+
+        # Preserve therapist-then-specialty ordering
+        generated_bios = [bios_by_id[custom_id] for custom_id in combinations if custom_id in bios_by_id]
 
-                if len(therapists) > 1:
-                    # For group practices: show both therapist progress and specialty progress
-                    self._log(f"[{overall_progress}/{total_combinations}] Generating {therapist.name} - {specialty.name}")
-                else:
-                    # For single therapist: simpler progress message
-                    self._log(f"Generating bio {overall_progress}/{total_combinations}: {therapist.name} - {specialty.name}")
+        self._log(f"\nGeneration complete! Total tokens used: {self.total_tokens_used}")
+        self._log(f"Estimated cost: ${self.total_cost:.4f}")
 
-                bio = self._generate_single_bio(therapist, specialty)
+        return generated_bios
 
-                if bio:
-                    generated_bios.append(bio)
-                else:
-                    self._log(f"Failed to generate bio for {therapist.name} - {specialty.name}")
+    async def generate_bios_async(
+        self,
+        therapists: List[Therapist],
+        specialties: List[Specialty],
+        max_concurrency: Optional[int] = None
+    ) -> List[GeneratedBio]:
+        """
+        Generate bios for all therapist-specialty combinations from an asyncio event loop.
 
-                # Small delay between API calls
-                if overall_progress < total_combinations:
-                    time.sleep(0.5)
+        Each combination is a real-time request run in a worker thread, with at most
+        max_concurrency in flight at once. Request pacing shares the requests_per_minute
+        budget with the synchronous path.
+
+        Args:
+            therapists: List of therapists
+            specialties: List of specialties
+            max_concurrency: Maximum requests in flight (defaults to max_workers)
+
+        Returns:
+            List of GeneratedBio objects, in therapist-then-specialty order
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or self.max_workers))
+
+        async def generate(therapist: Therapist, specialty: Specialty) -> Optional[GeneratedBio]:
+            async with semaphore:
+                return await asyncio.to_thread(self._generate_single_bio, therapist, specialty)
+
+        self._log(f"Generating {len(therapists) * len(specialties)} bio(s) for {len(therapists)} therapist(s)...")
+
+        results = await asyncio.gather(
+            *(generate(therapist, specialty) for therapist in therapists for specialty in specialties),
+            return_exceptions=True
+        )
+
+        generated_bios = []
+        for result in results:
+            if isinstance(result, GeneratedBio):
+                generated_bios.append(result)
+            elif isinstance(result, Exception):
+                logger.error("Error generating bio: %s", result, exc_info=result)
 
         self._log(f"\nGeneration complete! Total tokens used: {self.total_tokens_used}")
-        self._log(f"Estimated cost: ${self.total_tokens_used * 0.000009:.4f}")
+        self._log(f"Estimated cost: ${self.total_cost:.4f}")
 
         return generated_bios
 
-    def _generate_single_bio(
+    def _generate_with_batch(
+        self,
+        combinations: Dict[str, Tuple[Therapist, Specialty]]
+    ) -> Dict[str, GeneratedBio]:
+        """
+        Generate bios through a single Message Batches request.
+
+        Args:
+            combinations: Therapist-specialty pairs keyed by custom_id
+
+        Returns:
+            Successfully generated bios keyed by custom_id
+        """
+        batch_requests = [
+            {"custom_id": custom_id, "params": self._build_request_params(therapist, specialty)}
+            for custom_id, (therapist, specialty) in combinations.items()
+        ]
+
+        bios_by_id = {}
+        try:
+            batch = self.client.messages.batches.create(requests=batch_requests)
+            self._log(f"Submitted batch {batch.id}, waiting for results...")
+            if not self._wait_for_batch(batch.id):
+                # Batches can take up to 24h; give up and let the real-time path handle them
+                self._log(f"Batch {batch.id} not done after {self.batch_max_wait:.0f}s, canceling it")
+                self.client.messages.batches.cancel(batch.id)
+                return bios_by_id
+
+            for entry in self.client.messages.batches.results(batch.id):
+                therapist, specialty = combinations[entry.custom_id]
+
+                if entry.result.type != "succeeded":
+                    self._log(f"Batch request failed ({entry.result.type}) for {therapist.name} - {specialty.name}")
+                    continue
+
+                message = entry.result.message
+                self._track_usage(message.usage, BATCH_PRICE_MULTIPLIER)
+
+                if message.stop_reason == "max_tokens":
+                    # Left for the individual retry path, which can ask for a revision
+                    self._log(f"Batch bio was cut off for {therapist.name} - {specialty.name}")
+                    continue
+
+                bio = GeneratedBio(
+                    therapist_name=therapist.name,
+                    specialty_name=specialty.name,
+                    bio_text=message.content[0].text.strip(),
+                    source_about_url=therapist.source_url
+                )
+
+                if self._is_acceptable_length(bio):
+                    bios_by_id[entry.custom_id] = bio
+
+        except Exception as e:
+            self._log(f"Error processing message batch: {str(e)}")
+            logger.error("Error processing message batch: %s", e, exc_info=True)
+
+        return bios_by_id
+
+    def _generate_concurrently(
+        self,
+        combinations: Dict[str, Tuple[Therapist, Specialty]]
+    ) -> Dict[str, GeneratedBio]:
+        """
+        Generate bios with real-time requests on a bounded thread pool.
+
+        Args:
+            combinations: Therapist-specialty pairs keyed by custom_id
+
+        Returns:
+            Successfully generated bios keyed by custom_id
+        """
+        bios_by_id = {}
+        total = len(combinations)
+
+        with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as executor:
+            futures = {
+                executor.submit(self._generate_single_bio, therapist, specialty): custom_id
+                for custom_id, (therapist, specialty) in combinations.items()
+            }
+
+            for completed, future in enumerate(as_completed(futures), 1):
+                custom_id = futures[future]
+                therapist, specialty = combinations[custom_id]
+                bio = future.result()
+
+                if bio:
+                    bios_by_id[custom_id] = bio
+                    self._log(f"[{completed}/{total}] Generated {therapist.name} - {specialty.name}")
+                else:
+                    self._log(f"[{completed}/{total}] Failed to generate bio for {therapist.name} - {specialty.name}")
+
+        return bios_by_id
+
+    def _generate_grouped(
+        self,
+        combinations: Dict[str, Tuple[Therapist, Specialty]]
+    ) -> Dict[str, GeneratedBio]:
+        """
+        Generate bios with one real-time request per group of a therapist's specialties.
+
+        Args:
+            combinations: Therapist-specialty pairs keyed by "<therapist_idx>-<specialty_idx>"
+
+        Returns:
+            Successfully generated bios keyed by custom_id
+        """
+        # Collect each therapist's specialties, then split them into groups of specialties_per_call
+        by_therapist = {}
+        for custom_id, (therapist, specialty) in combinations.items():
+            therapist_idx = custom_id.split("-", 1)[0]
+            by_therapist.setdefault(therapist_idx, (therapist, []))[1].append((custom_id, specialty))
+
+        groups = []
+        for therapist, specialty_items in by_therapist.values():
+            for start in range(0, len(specialty_items), self.specialties_per_call):
+                groups.append((therapist, dict(specialty_items[start:start + self.specialties_per_call])))
+
+        bios_by_id = {}
+        with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as executor:
+            futures = {
+                executor.submit(self._generate_bio_group, therapist, group): therapist
+                for therapist, group in groups
+            }
+
+            for completed, future in enumerate(as_completed(futures), 1):
+                group_bios = future.result()
+                bios_by_id.update(group_bios)
+                self._log(f"[{completed}/{len(groups)}] Generated {len(group_bios)} bio(s) for {futures[future].name}")
+
+        return bios_by_id
+
+    def _generate_bio_group(
+        self,
+        therapist: Therapist,
+        specialties_by_id: Dict[str, Specialty]
+    ) -> Dict[str, GeneratedBio]:
+        """
+        Generate bios for several of a therapist's specialties in a single request.
+
+        Args:
+            therapist: The therapist
+            specialties_by_id: Specialties to generate, keyed by custom_id
+
+        Returns:
+            Bios that parsed and passed the length check, keyed by custom_id
+        """
+        therapist_block, specialties_block = create_bio_prompt_batch(
+            therapist_name=therapist.name,
+            credentials=therapist.credentials or "",
+            original_bio=therapist.bio_text,
+            specialties=[(specialty.name, specialty.content) for specialty in specialties_by_id.values()]
+        )
+        params = self._build_cached_params(therapist_block, specialties_block)
+        params["max_tokens"] = self.max_tokens * len(specialties_by_id)
+
+        bios_by_id = {}
+        try:
+            self._rate_limiter.acquire()
+            response = self.client.messages.create(**params)
+            self._track_usage(response.usage)
+
+            bio_texts = self._parse_bio_group(response.content[0].text, list(specialties_by_id.values()))
+            for custom_id, specialty in specialties_by_id.items():
+                bio_text = bio_texts.get(specialty.name)
+                if not bio_text:
+                    continue
+
+                bio = GeneratedBio(
+                    therapist_name=therapist.name,
+                    specialty_name=specialty.name,
+                    bio_text=bio_text,
+                    source_about_url=therapist.source_url
+                )
+
+                if self._is_acceptable_length(bio):
+                    bios_by_id[custom_id] = bio
+
+        except Exception as e:
+            self._log(f"Error generating bio group for {therapist.name}: {str(e)}")
+            logger.error("Error generating bio group for %s: %s", therapist.name, e, exc_info=True)
+
+        return bios_by_id
+
+    def _parse_bio_group(self, response_text: str, specialties: List[Specialty]) -> Dict[str, str]:
+        """
+        Parse a grouped response into bio texts keyed by specialty name.
+
+        Entries are matched by specialty name, falling back to their position when the
+        model renames a specialty.
+
+        Args:
+            response_text: Raw model output containing a JSON array
+            specialties: Specialties in the order they were requested
+
+        Returns:
+            Bio texts keyed by specialty name
+
+        Raises:
+            ValueError: If the response has no JSON array
+        """
+        # Tolerate code fences or stray text around the array
+        start, end = response_text.find('['), response_text.rfind(']')
+        if start == -1 or end < start:
+            raise ValueError("Grouped response did not contain a JSON array")
+
+        entries = json.loads(response_text[start:end + 1])
+        names = {specialty.name for specialty in specialties}
+
+        bio_texts = {}
+        for position, entry in enumerate(entries):
+            if not isinstance(entry, dict) or not entry.get("bio"):
+                continue
+
+            name = entry.get("specialty")
+            if name not in names and position < len(specialties):
+                name = specialties[position].name
+            if name in names:
+                bio_texts.setdefault(name, str(entry["bio"]).strip())
+
+        return bio_texts
+
+    def _wait_for_batch(self, batch_id: str, max_delay: float = 60.0) -> bool:
+        """
+        Poll a message batch with exponential backoff until processing has ended.
+
+        Args:
+            batch_id: ID of the submitted message batch
+            max_delay: Upper bound on the delay between polls, in seconds
+
+        Returns:
+            True if the batch ended, False if batch_max_wait ran out first
+        """
+        deadline = time.monotonic() + self.batch_max_wait
+        delay = 2.0
+        while True:
+            batch = self.client.messages.batches.retrieve(batch_id)
+            if batch.processing_status == "ended":
+                return True
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+
+            counts = batch.request_counts
+            self._log(f"Batch in progress: {counts.succeeded + counts.errored} done, {counts.processing} processing")
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, max_delay)
+
+    def _build_request_params(
         self,
         therapist: Therapist,
         specialty: Specialty
-    ) -> Optional[GeneratedBio]:
+    ) -> dict:
         """
-        Generate a single bio for a therapist-specialty combination.
+        Build the Messages API parameters for a therapist-specialty combination.
 
         Args:
             therapist: The therapist
             specialty: The specialty
 
         Returns:
-            GeneratedBio or None if generation failed
+            Keyword arguments for messages.create (also used as batch request params)
         """
-        # Create prompt
-        prompt = create_bio_prompt(
+        therapist_block, specialty_block = create_bio_prompt(
             therapist_name=therapist.name,
             credentials=therapist.credentials or "",
             original_bio=therapist.bio_text,
@@ -123,64 +527,231 @@ class BioGenerator:
             specialty_content=specialty.content
         )
 
+        return self._build_cached_params(therapist_block, specialty_block)
+
+    def _build_cached_params(self, therapist_block: str, specialty_block: str) -> dict:
+        """
+        Build Messages API parameters with prompt caching on the static prefixes.
+
+        The system prompt (persona plus static requirements) and the therapist block
+        are marked with cache_control, in that order, so every call reuses the cached
+        system prefix and every specialty after the first for a given therapist also
+        reuses the cached therapist block.
+
+        Args:
+            therapist_block: Per-therapist prompt prefix
+            specialty_block: Per-specialty prompt suffix
+
+        Returns:
+            Keyword arguments for messages.create
+        """
+        return {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "system": [
+                {"type": "text", "text": BIO_SYSTEM_PROMPT, "cache_control": CACHE_CONTROL}
+            ],
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": therapist_block, "cache_control": CACHE_CONTROL},
+                        {"type": "text", "text": specialty_block}
+                    ]
+                }
+            ]
+        }
+
+    def _build_revision_params(self, params: dict, bio: GeneratedBio, truncated: bool) -> dict:
+        """
+        Extend a request with the previous bio and a follow-up asking to fix its length.
+
+        Args:
+            params: Parameters of the request that produced the bio
+            bio: The generated bio that missed the word count
+            truncated: Whether the bio was cut off by the max_tokens limit
+
+        Returns:
+            Keyword arguments for messages.create
+        """
+        return {
+            **params,
+            "messages": params["messages"] + [
+                {"role": "assistant", "content": bio.bio_text},
+                {"role": "user", "content": create_revision_prompt(bio.word_count, truncated)}
+            ]
+        }
+
+    def _get_cached_bio(
+        self,
+        therapist: Therapist,
+        specialty: Specialty,
+        params: dict
+    ) -> Optional[GeneratedBio]:
+        """
+        Look up a bio previously generated from the same request parameters.
+
+        Args:
+            therapist: The therapist
+            specialty: The specialty
+            params: Messages API parameters for the combination
+
+        Returns:
+            Cached GeneratedBio, or None if caching is off or nothing is cached
+        """
+        if self.cache is None:
+            return None
+
+        bio_text = self.cache.get(BioCache.make_key(params))
+        if bio_text is None:
+            return None
+
+        return GeneratedBio(
+            therapist_name=therapist.name,
+            specialty_name=specialty.name,
+            bio_text=bio_text,
+            source_about_url=therapist.source_url
+        )
+
+    def _cache_bio(self, params: dict, bio: GeneratedBio):
+        """Store a generated bio under its request parameters, if caching is on."""
+        if self.cache is None:
+            return
+
+        try:
+            self.cache.set(BioCache.make_key(params), bio.bio_text)
+        except OSError as e:
+            logger.warning("Could not write bio cache entry: %s", e)
+
+    def _track_usage(self, usage, price_multiplier: float = 1.0) -> Tuple[int, float]:
+        """
+        Add a response's token usage and cost to the running totals.
+
+        Args:
+            usage: Usage from a Messages API response
+            price_multiplier: Discount applied to the cost (BATCH_PRICE_MULTIPLIER for batches)
+
+        Returns:
+            Tuple of (tokens, cost in dollars); tokens include prompt cache reads and
+            writes, which are priced at their own rates
+        """
+        cache_read = getattr(usage, "cache_read_input_tokens", None) or 0
+        cache_write = getattr(usage, "cache_creation_input_tokens", None) or 0
+        tokens = usage.input_tokens + usage.output_tokens + cache_read + cache_write
+        cost = (
+            usage.input_tokens * INPUT_COST_PER_TOKEN
+            + usage.output_tokens * OUTPUT_COST_PER_TOKEN
+            + cache_read * CACHE_READ_COST_PER_TOKEN
+            + cache_write * CACHE_WRITE_COST_PER_TOKEN
+        ) * price_multiplier
+        with self._usage_lock:
+            self.total_tokens_used += tokens
+            self.total_cost += cost
+        return tokens, cost
+
+    def _is_acceptable_length(self, bio: GeneratedBio) -> bool:
+        """Check a bio's word count against the bounds (target: 110 words, acceptable: 90-135)."""
+        word_count = bio.word_count
+        if word_count < 90:
+            self._log(f"Bio too short ({word_count} words)")
+            return False
+        if word_count > 135:
+            self._log(f"Bio too long ({word_count} words)")
+            return False
+
+        return True
+
+    def _generate_single_bio(
+        self,
+        therapist: Therapist,
+        specialty: Specialty,
+        usage_log: Optional[List[Tuple[int, float]]] = None
+    ) -> Optional[GeneratedBio]:
+        """
+        Generate a single bio for a therapist-specialty combination.
+
+        Args:
+            therapist: The therapist
+            specialty: The specialty
+            usage_log: Optional list that receives (tokens, cost) for each API call made here,
+                for callers sharing this generator that need their own usage rather than
+                total_tokens_used
+
+        Returns:
+            GeneratedBio or None if generation failed
+        """
+        base_params = self._build_request_params(therapist, specialty)
+
+        cached_bio = self._get_cached_bio(therapist, specialty, base_params)
+        if cached_bio:
+            return cached_bio
+
+        params = base_params
+
         # Try to generate with retries
         max_retries = 2
         for attempt in range(max_retries):
             try:
-                response = self.client.messages.create(
-                    model=self.model,
-                    max_tokens=self.max_tokens,
-                    temperature=self.temperature,
-                    system=SYSTEM_PROMPT,
-                    messages=[
-                        {"role": "user", "content": prompt}
-                    ]
-                )
-
-                # Extract bio text
-                bio_text = response.content[0].text.strip()
+                self._rate_limiter.acquire()
+                response = self.client.messages.create(**params)
 
                 # Track token usage
-                self.total_tokens_used += response.usage.input_tokens + response.usage.output_tokens
-
-                # Validate word count (target: 110 words, acceptable: 100-125)
-                word_count = len(bio_text.split())
-
-                if word_count < 90:
-                    self._log(f"Bio too short ({word_count} words), retrying...")
-                    if attempt < max_retries - 1:
-                        continue
-                elif word_count > 135:
-                    self._log(f"Bio too long ({word_count} words), retrying...")
-                    if attempt < max_retries - 1:
-                        continue
-
-                # Success!
-                return GeneratedBio(
+                call_usage = self._track_usage(response.usage)
+                if usage_log is not None:
+                    usage_log.append(call_usage)
+
+                bio = GeneratedBio(
                     therapist_name=therapist.name,
                     specialty_name=specialty.name,
-                    bio_text=bio_text,
+                    bio_text=response.content[0].text.strip(),
                     source_about_url=therapist.source_url
                 )
 
+                # Validate length; a max_tokens stop means the bio was cut off
+                truncated = response.stop_reason == "max_tokens"
+                if truncated:
+                    self._log("Bio was cut off at the max_tokens limit")
+
+                if (truncated or not self._is_acceptable_length(bio)) and attempt < max_retries - 1:
+                    # Ask for a revision in the same conversation rather than a blind
+                    # regeneration, so the cached prompt prefix is reused
+                    self._log("Revising...")
+                    params = self._build_revision_params(params, bio, truncated)
+                    continue
+
+                if truncated:
+                    # Never hand back a cut-off bio as complete
+                    logger.warning("Final attempt was truncated, trying fallback prompt for %s - %s", therapist.name, specialty.name)
+                    return self._generate_with_fallback(therapist, specialty, usage_log)
+
+                # Success! An off-length last attempt is still returned for this run,
+                # but only bios that pass the length check are cached for later runs
+                if self._is_acceptable_length(bio):
+                    self._cache_bio(base_params, bio)
+                return bio
+
             except Exception as e:
-                error_msg = f"Error generating bio (attempt {attempt + 1}/{max_retries}): {str(e)}"
-                self._log(error_msg)
-                logger.error(error_msg, exc_info=True)
+                self._log(f"Error generating bio (attempt {attempt + 1}/{max_retries}): {str(e)}")
+                logger.error("Error generating bio (attempt %d/%d): %s", attempt + 1, max_retries, e, exc_info=True)
 
                 if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
+                    if isinstance(e, RateLimitError):
+                        time.sleep(_retry_after_seconds(e))  # Wait as long as the API asks
+                    else:
+                        time.sleep(2 ** attempt)  # Exponential backoff
                 else:
                     # Try fallback prompt on final attempt
-                    logger.warning(f"All retries failed, trying fallback prompt for {therapist.name} - {specialty.name}")
-                    return self._generate_with_fallback(therapist, specialty)
+                    logger.warning("All retries failed, trying fallback prompt for %s - %s", therapist.name, specialty.name)
+                    return self._generate_with_fallback(therapist, specialty, usage_log)
 
         return None
 
     def _generate_with_fallback(
         self,
         therapist: Therapist,
-        specialty: Specialty
+        specialty: Specialty,
+        usage_log: Optional[List[Tuple[int, float]]] = None
     ) -> Optional[GeneratedBio]:
         """
         Try generating with a simpler fallback prompt.
@@ -188,30 +759,32 @@ class BioGenerator:
         Args:
             therapist: The therapist
             specialty: The specialty
+            usage_log: Optional list that receives (tokens, cost) for the API call
 
         Returns:
             GeneratedBio or None if generation failed
         """
         try:
-            prompt = create_fallback_bio_prompt(
+            therapist_block, specialty_block = create_fallback_bio_prompt(
                 therapist_name=therapist.name,
                 credentials=therapist.credentials or "",
                 original_bio=therapist.bio_text,
                 specialty_name=specialty.name
             )
 
+            self._rate_limiter.acquire()
             response = self.client.messages.create(
-                model=self.model,
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-                system=SYSTEM_PROMPT,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
+                **self._build_cached_params(therapist_block, specialty_block)
             )
 
             bio_text = response.content[0].text.strip()
-            self.total_tokens_used += response.usage.input_tokens + response.usage.output_tokens
+            call_usage = self._track_usage(response.usage)
+            if usage_log is not None:
+                usage_log.append(call_usage)
+
+            if response.stop_reason == "max_tokens":
+                self._log("Fallback bio was cut off at the max_tokens limit")
+                return None
 
             return GeneratedBio(
                 therapist_name=therapist.name,
@@ -221,9 +794,8 @@ class BioGenerator:
             )
 
         except Exception as e:
-            error_msg = f"Fallback generation also failed: {str(e)}"
-            self._log(error_msg)
-            logger.error(error_msg, exc_info=True)
+            self._log(f"Fallback generation also failed: {str(e)}")
+            logger.error("Fallback generation also failed: %s", e, exc_info=True)
             return None
 
     def get_estimated_cost(self, num_bios: int) -> float:
@@ -236,9 +808,4 @@ class BioGenerator:
         Returns:
             Estimated cost in dollars
         """
-        # Rough estimate: ~5000 tokens per bio (input + output)
-        estimated_tokens = num_bios * 5000
-        # Claude Sonnet 4.5 pricing: $3 per million input tokens, $15 per million output tokens
-        # Average: ~$9 per million tokens
-        cost_per_token = 0.000009
-        return estimated_tokens * cost_per_token
+        return num_bios * EST_TOKENS_PER_BIO * COST_PER_TOKEN
@@ -1,4 +1,5 @@
 """Prompt templates for bio generation."""
+from typing import List, Tuple
 
 SYSTEM_PROMPT = """You are an expert copywriter specializing in writing compelling, authentic content for mental health professionals. Your writing:
 - Precisely matches the therapist's existing voice, tone, and style
@@ -7,6 +8,72 @@ SYSTEM_PROMPT = """You are an expert copywriter specializing in writing compelli
 - Focuses on how the therapist helps clients with specific concerns
 - Stays within the specified word count"""
 
+# Rules shared by every bio prompt. Kept free of per-call values so that, together with
+# SYSTEM_PROMPT, it forms a byte-identical prefix that prompt caching can reuse.
+STATIC_REQUIREMENTS = """**Requirements for every bio:**
+1. Write EXACTLY 110 words (100-125 is acceptable)
+2. Precisely match the voice, tone, style, and language patterns from the therapist's original bio
+3. Include credentials naturally if relevant to the specialty
+4. Maintain the exact same level of formality, personality, and aesthetic as the original content
+5. Write in third person (he/she/they) if the original bio uses third person, or first person (I) if it uses first person
+6. Do NOT use em dashes (—) anywhere in the bio - use commas, periods, semicolons, or regular hyphens instead
+
+**Output only the bio text - no additional commentary, headers, or explanation.**"""
+
+# Writing guidance shared by every bio. Besides steering tone, it brings the static
+# system prompt past the 1024-token minimum a prompt-cache prefix needs on Sonnet, so
+# the cache_control marker on it actually produces cache hits.
+STYLE_GUIDE = """**Style guide for specialty bio boxes:**
+
+*Purpose and reader.* A bio box sits on a specialty page (for example "Anxiety Therapy" or "Couples Counseling") next to the practice's description of that service. The reader is usually someone who is struggling with that exact concern, has found the page through a search, and is deciding whether this particular therapist feels like the right person to contact. The bio box should help them picture what working with this therapist on this concern would be like. It is not a résumé and not a general introduction; the therapist's full biography lives elsewhere on the site.
+
+*Matching the therapist's voice.* Read the original bio closely before writing. Notice sentence length, vocabulary, warmth, humor, use of contractions, whether the therapist speaks directly to the reader ("you"), and how they describe their own work. Reuse their characteristic phrases and images where they fit, but never copy whole sentences. If the original is formal and clinical, stay formal and clinical. If it is casual and conversational, stay casual and conversational. Keep the same point of view (first or third person) and the same pronouns the original uses for the therapist. The finished bio should read as if the therapist wrote it on a good day.
+
+*Structure.* Write a single paragraph with no headings, bullet points, bold text, or line breaks. A typical shape is: one sentence connecting the therapist to the specialty, two or three sentences about how they approach this concern (methods, training, or philosophy drawn from the original bio and the specialty description), and a closing sentence about what clients can expect or hope to gain from working with them. Vary the opening across specialties; do not begin every bio with the therapist's name followed by their credentials.
+
+*Using the source material.* Only state facts that are supported by the original bio or the specialty description. Do not invent degrees, licenses, certifications, years of experience, populations served, locations, awards, or affiliations. If the original bio mentions a method or training that clearly applies to the specialty (for example EMDR for trauma, the Gottman Method for couples, or CBT for anxiety), feature it. If nothing in the original bio is specific to the specialty, describe how the therapist's general approach and values apply to this concern rather than fabricating specialized experience.
+
+*Clinical and ethical language.* Describe the concern with compassion and without stigma, and prefer person-first language ("people living with depression", not "depressives"). Do not promise outcomes or cures, and avoid words like "guarantee", "fix", or "eliminate". Do not diagnose the reader or suggest that they have a particular condition. Do not mention medication unless the original bio does. Do not include testimonials, client stories, or anything that could identify a client. Avoid crisis language, and do not describe the therapist as available for emergencies.
+
+*Word choice.* Prefer concrete, specific language over generic filler. Avoid clichés common in therapy marketing, such as "safe space", "journey", "holistic", "empower", "tools and strategies", "thrive", and "best self", unless the therapist clearly uses that phrase in their own bio. Avoid superlatives and unverifiable claims such as "leading expert" or "the best". Keep jargon to what the therapist's own bio uses, and briefly explain any acronym a lay reader may not know.
+
+*Adapting to who the specialty serves.* Let the specialty shape who the bio speaks to. For couples or relationship work, refer to partners and the relationship rather than a single client, and avoid assuming genders or relationship structures. For family therapy, speak to the family as a whole. For child and adolescent work, remember that the reader is usually a parent or caregiver, so describe how the therapist works with young people and how they involve the family. For groups, workshops, or intensives, describe the format only as far as the specialty description does. For assessment or testing services, focus on the clarity and understanding the process provides rather than on therapy.
+
+*Inclusive and respectful language.* Use gender-neutral wording for clients unless the specialty is explicitly for a particular group, such as women's issues or men's groups. Describe identities the way the communities themselves do, for example LGBTQ+ affirming, neurodivergent, or BIPOC, and only mention identity-focused work when the original bio or specialty description supports it. Do not make assumptions about the reader's culture, faith, family, finances, or relationship status.
+
+*Things to leave out.* No calls to action, phone numbers, email addresses, links, prices, insurance details, office hours, or scheduling instructions; the page handles those. Do not mention other specialties or other therapists at the practice. Do not refer to "this page", "this website", or the bio itself.
+
+*Length.* Count words before answering and revise until the bio is within the required range. Cut filler before cutting specifics about the therapist's approach."""
+
+# Full system prompt for bio generation: persona, static requirements, then the style guide
+BIO_SYSTEM_PROMPT = f"{SYSTEM_PROMPT}\n\n{STATIC_REQUIREMENTS}\n\n{STYLE_GUIDE}"
+
+# Prompt budgets for scraped text, in tokens
+MAX_BIO_TOKENS = 400
+MAX_SPECIALTY_TOKENS = 200
+
+# English prose averages roughly 0.75 words per token
+WORDS_PER_TOKEN = 0.75
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Trim text to approximately max_tokens tokens, cutting on a word boundary.
+
+    Args:
+        text: Text to trim
+        max_tokens: Token budget
+
+    Returns:
+        The text, unchanged if it already fits the budget
+    """
+    max_words = int(max_tokens * WORDS_PER_TOKEN)
+    words = text.split(maxsplit=max_words)
+    if len(words) <= max_words:
+        return text
+
+    return ' '.join(words[:max_words])
+
 
 def create_bio_prompt(
     therapist_name: str,
@@ -14,10 +81,16 @@ def create_bio_prompt(
     original_bio: str,
     specialty_name: str,
     specialty_content: str
-) -> str:
+) -> Tuple[str, str]:
     """
     Create a prompt for generating a specialty-specific bio.
 
+    The shared rules live in STATIC_REQUIREMENTS (sent with the system prompt).
+    The prompt itself is split into a therapist block, which is identical for
+    every specialty generated for the same therapist (and so can be
+    prompt-cached), and a specialty block holding everything that changes per
+    specialty.
+
     Args:
         therapist_name: Name of the therapist
         credentials: Therapist's credentials (e.g., "LCSW, PhD")
@@ -26,31 +99,88 @@ def create_bio_prompt(
         specialty_content: Description of the specialty from the website
 
     Returns:
-        Formatted prompt string
+        Tuple of (therapist_block, specialty_block)
     """
+    therapist_block = create_therapist_block(therapist_name, credentials, original_bio)
     creds_text = f" ({credentials})" if credentials else ""
 
-    prompt = f"""Generate a 110-word bio box for {therapist_name}{creds_text} that will appear on the "{specialty_name}" page of their therapy website.
-
-**Therapist's Original Bio:**
-{original_bio}
+    specialty_block = f"""Generate a 110-word bio box for {therapist_name}{creds_text} that will appear on the "{specialty_name}" page of their therapy website.
 
 **About the Specialty ({specialty_name}):**
-{specialty_content[:500]}
+{truncate_to_tokens(specialty_content, MAX_SPECIALTY_TOKENS)}
 
-**Requirements:**
-1. Write EXACTLY 110 words (100-125 is acceptable)
-2. Precisely match the voice, tone, style, and language patterns from {therapist_name}'s original bio
-3. Highlight their relevant experience, training, or approach specifically related to {specialty_name}
-4. Include credentials naturally if relevant to this specialty
-5. Focus on how {therapist_name} helps clients dealing with this specific concern
-6. Maintain the exact same level of formality, personality, and aesthetic as the original content
-7. Write in third person (he/she/they) if the original bio uses third person, or first person (I) if it uses first person
-8. Do NOT use em dashes (—) anywhere in the bio - use commas, periods, semicolons, or regular hyphens instead
+**Focus for this specialty:**
+- Highlight their relevant experience, training, or approach specifically related to {specialty_name}
+- Focus on how {therapist_name} helps clients dealing with this specific concern"""
 
-**Output only the bio text - no additional commentary, headers, or explanation.**"""
+    return therapist_block, specialty_block
+
+
+def create_bio_prompt_batch(
+    therapist_name: str,
+    credentials: str,
+    original_bio: str,
+    specialties: List[Tuple[str, str]]
+) -> Tuple[str, str]:
+    """
+    Create a prompt for generating bios for several specialties in a single call.
+
+    Uses the same cacheable therapist block as create_bio_prompt, followed by one
+    numbered section per specialty and an instruction to answer with a JSON array.
+
+    Args:
+        therapist_name: Name of the therapist
+        credentials: Therapist's credentials (e.g., "LCSW, PhD")
+        original_bio: The therapist's original bio text
+        specialties: List of (specialty_name, specialty_content) pairs
+
+    Returns:
+        Tuple of (therapist_block, specialties_block)
+    """
+    therapist_block = create_therapist_block(therapist_name, credentials, original_bio)
+    creds_text = f" ({credentials})" if credentials else ""
+
+    specialty_sections = "\n\n".join(
+        f"## Specialty {i}: {name}\n{truncate_to_tokens(content, MAX_SPECIALTY_TOKENS)}"
+        for i, (name, content) in enumerate(specialties, 1)
+    )
 
-    return prompt
+    specialties_block = f"""Generate a separate 110-word bio box for {therapist_name}{creds_text} for each of the {len(specialties)} specialties below. Each bio will appear on that specialty's page of their therapy website.
+
+{specialty_sections}
+
+**Focus for each specialty:**
+- Highlight their relevant experience, training, or approach specifically related to that specialty
+- Focus on how {therapist_name} helps clients dealing with that specific concern
+- Write each bio independently; do not refer to the other specialties
+
+**Output format:** Instead of plain bio text, output only a JSON array with one object per specialty, in the order given: [{{"specialty": "<specialty name>", "bio": "<bio text>"}}]"""
+
+    return therapist_block, specialties_block
+
+
+def create_therapist_block(
+    therapist_name: str,
+    credentials: str,
+    original_bio: str
+) -> str:
+    """
+    Create the per-therapist prompt prefix shared by every specialty.
+
+    Args:
+        therapist_name: Name of the therapist
+        credentials: Therapist's credentials
+        original_bio: The therapist's original bio text
+
+    Returns:
+        Formatted therapist block
+    """
+    creds_text = f" ({credentials})" if credentials else ""
+
+    return f"""**Therapist:** {therapist_name}{creds_text}
+
+**Therapist's Original Bio:**
+{truncate_to_tokens(original_bio, MAX_BIO_TOKENS)}"""
 
 
 def create_fallback_bio_prompt(
@@ -58,7 +188,7 @@ def create_fallback_bio_prompt(
     credentials: str,
     original_bio: str,
     specialty_name: str
-) -> str:
+) -> Tuple[str, str]:
     """
     Create a fallback prompt when specialty content is minimal or missing.
 
@@ -69,29 +199,42 @@ def create_fallback_bio_prompt(
         specialty_name: Name of the specialty
 
     Returns:
-        Formatted prompt string
+        Tuple of (therapist_block, specialty_block)
     """
+    therapist_block = create_therapist_block(therapist_name, credentials, original_bio)
     creds_text = f" ({credentials})" if credentials else ""
 
-    prompt = f"""Generate a 110-word bio box for {therapist_name}{creds_text} that will appear on the "{specialty_name}" page of their therapy website.
-
-**Therapist's Original Bio:**
-{original_bio}
+    specialty_block = f"""Generate a 110-word bio box for {therapist_name}{creds_text} that will appear on the "{specialty_name}" page of their therapy website.
 
 **Specialty Focus:**
 {specialty_name}
 
-**Requirements:**
-1. Write EXACTLY 110 words (100-125 is acceptable)
-2. Precisely match the voice, tone, style, and language patterns from {therapist_name}'s original bio
-3. Adapt their general approach and experience to be relevant for clients seeking help with {specialty_name}
-4. If their bio mentions relevant training or experience for {specialty_name}, emphasize it
-5. If not, focus on their general therapeutic approach and how it helps with concerns like {specialty_name}
-6. Include credentials naturally
-7. Maintain the exact same level of formality, personality, and aesthetic as the original content
-8. Write in the same person (first/third) as the original bio
-9. Do NOT use em dashes (—) anywhere in the bio - use commas, periods, semicolons, or regular hyphens instead
+**Focus for this specialty:**
+- Adapt their general approach and experience to be relevant for clients seeking help with {specialty_name}
+- If their bio mentions relevant training or experience for {specialty_name}, emphasize it
+- If not, focus on their general therapeutic approach and how it helps with concerns like {specialty_name}"""
 
-**Output only the bio text - no additional commentary, headers, or explanation.**"""
+    return therapist_block, specialty_block
 
-    return prompt
+
+def create_revision_prompt(word_count: int, truncated: bool) -> str:
+    """
+    Create a follow-up turn asking the model to fix the length of its previous bio.
+
+    Args:
+        word_count: Word count of the previous bio
+        truncated: Whether the previous bio was cut off by the max_tokens limit
+
+    Returns:
+        Formatted prompt string
+    """
+    if truncated:
+        problem = "The bio above was cut off before it finished."
+    elif word_count < 110:
+        problem = f"The bio above is only {word_count} words."
+    else:
+        problem = f"The bio above is {word_count} words."
+
+    return f"""{problem} Rewrite it as a complete bio of about 110 words (100-125 is acceptable) without changing its meaning, voice, or point of view.
+
+**Output only the bio text - no additional commentary, headers, or explanation.**"""
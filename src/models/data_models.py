@@ -1,34 +1,46 @@
 """Data models for the therapist bio generator."""
-from pydantic import BaseModel, HttpUrl
+from dataclasses import dataclass, field
 from typing import List, Optional
 
+# Plain frozen dataclasses: every value here is built internally from URLs that the
+# scraper has already normalized and validated, so per-instance validation isn't needed.
 
-class Therapist(BaseModel):
+
+@dataclass(frozen=True)
+class Therapist:
     """Represents a therapist/clinician found on the website."""
     name: str
-    credentials: Optional[str] = None
     bio_text: str
-    source_url: HttpUrl
+    source_url: str
+    credentials: Optional[str] = None
 
 
-class Specialty(BaseModel):
+@dataclass(frozen=True)
+class Specialty:
     """Represents a therapy specialty/service offered."""
     name: str
     content: str
-    url: HttpUrl
+    url: str
 
 
-class GeneratedBio(BaseModel):
+@dataclass(frozen=True)
+class GeneratedBio:
     """Represents a generated bio for a therapist-specialty combination."""
     therapist_name: str
     specialty_name: str
     bio_text: str  # Should be ~150 words
-    source_about_url: HttpUrl
+    source_about_url: str
+    word_count: int = field(init=False, compare=False)
+
+    def __post_init__(self):
+        # Count words once at construction (frozen, so set through object.__setattr__)
+        object.__setattr__(self, 'word_count', len(self.bio_text.split()))
 
 
-class ScrapingResult(BaseModel):
+@dataclass(frozen=True)
+class ScrapingResult:
     """Result of scraping a therapy website."""
-    website_url: HttpUrl
+    website_url: str
     therapists: List[Therapist]
     specialties: List[Specialty]
-    errors: List[str] = []
+    errors: List[str] = field(default_factory=list)
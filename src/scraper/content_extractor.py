@@ -1,10 +1,154 @@
 """Extract content from therapy website pages."""
+import logging
 import re
-from bs4 import BeautifulSoup
+from itertools import islice
+import lxml.html
+from lxml import etree
+from lxml.html import HtmlElement
 from typing import List, Optional, Tuple
-from urllib.parse import urlparse
+from urllib.parse import ParseResult, urlparse
 from ..models.data_models import Therapist, Specialty
 
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Precompiled patterns (compiled once at import instead of looked up on every call)
+_HEADING_PREFIX_RE = re.compile(r'^(About|Meet|Dr\.?|Mr\.?|Ms\.?|Mrs\.?)\s+', re.IGNORECASE)
+_HONORIFIC_PREFIX_RE = re.compile(r'^(Dr\.?|Mr\.?|Ms\.?|Mrs\.?|Miss)\s+', re.IGNORECASE)
+_TITLE_NAME_RE = re.compile(r'(?:About|Meet|Dr\.?|)\s*([A-Z][a-z]+\s+[A-Z][a-z]+)')
+_INTRO_PATTERNS = [
+    re.compile(r"I'm\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2})"),
+    re.compile(r"I am\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2})"),
+    re.compile(r"My name is\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2})"),
+]
+# Name followed by credentials, e.g. "Jane Doe, LCSW, PhD" or "John Smith MA, LPC"
+_NAME_CRED_RE = re.compile(
+    r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3})\s*[,\s]+'
+    r'([A-Z]{2,6}(?:-[A-Z]+)?(?:[,\s]+[A-Z]{2,6}(?:-[A-Z]+)?)*)'
+)
+_CRED_RE = re.compile(r'\b([A-Z]{2,6}(?:-[A-Z]+)?)\b')
+_WS_RE = re.compile(r'\s+')
+# Lowercase pattern matched against casefolded text, so the engine doesn't case-fold every character
+_FIRST_PERSON_RE = re.compile(
+    r"\b(i am|i'm|i have|i've|i specialize|i work|i help|my practice|my approach|my background)\b"
+)
+_LEARN_MORE_RE = re.compile(r'(learn more|read more|read bio|view profile|meet)', re.IGNORECASE)
+_TEAM_CLASS_RE = re.compile(r'(team|staff|clinician|therapist|member)', re.IGNORECASE)
+_PERSON_NAME_SHAPE_RE = re.compile(r'^[A-Z][a-z]+\s+[A-Z]')
+
+_GENERIC_PATHS = frozenset({
+    'about', 'team', 'staff', 'our-team', 'our-therapists',
+    'our-staff', 'clinicians', 'therapists', 'meet-the-team'
+})
+_URL_NAME_PREFIXES = ('about-', 'meet-', 'dr-', 'doctor-', 'therapist-')
+_URL_STOP_WORDS = frozenset({'and', 'the', 'of', 'at', 'in', 'on', 'for', 'to'})
+_DIRECTIONAL_WORDS = frozenset({'east', 'west', 'north', 'south', 'new'})
+_GENERIC_TERMS = (
+    'therapist', 'counselor', 'psychologist', 'psychiatrist',
+    'therapy', 'counseling', 'psychotherapy', 'services',
+    'about', 'welcome', 'home', 'contact', 'why', 'how', 'what',
+    'our', 'team', 'staff', 'practice', 'clinic', 'center'
+)
+_LOCATION_TERMS = (
+    'saint', 'st.', 'san', 'santa', 'port', 'mount', 'fort',
+    'lake', 'city', 'beach', 'river', 'bay', 'valley', 'springs',
+    'hills', 'heights', 'park', 'grove', 'point', 'island',
+    'college', 'university', 'hospital', 'center', 'institute'
+)
+# Single-pass alternations over the lowercased text; whole words only (optionally plural)
+# so names like "Susan" or "Howard" aren't rejected for containing "san" or "how"
+_GENERIC_TERMS_RE = re.compile(r'(?<!\w)(?:' + '|'.join(map(re.escape, _GENERIC_TERMS)) + r')s?(?!\w)')
+_LOCATION_TERMS_RE = re.compile(r'(?<!\w)(?:' + '|'.join(map(re.escape, _LOCATION_TERMS)) + r')s?(?!\w)')
+# Common therapy credentials
+_COMMON_CREDENTIALS = frozenset({
+    'LCSW', 'LMFT', 'LMHC', 'PHD', 'PSYD', 'MD', 'LCSW-C',
+    'LPC', 'LPCC', 'LCPC', 'MSW', 'MA', 'MS', 'CADC', 'NCC',
+    'LICSW', 'LISW', 'LCMHC', 'LCAT', 'ATR', 'RN', 'PMHNP',
+    'CST', 'ACS', 'ACSW', 'LCADC', 'CAADC', 'CSAC', 'LMHP'
+})
+
+# lxml parsing and compiled XPath queries (raw lxml avoids BeautifulSoup's per-tag wrapper objects)
+# Comments and processing instructions are dropped while parsing, and ids aren't indexed
+# (nothing looks elements up by id), which keeps the tree small on bloated pages
+_HTML_PARSER = lxml.html.HTMLParser(
+    encoding='utf-8',
+    remove_comments=True,
+    remove_pis=True,
+    collect_ids=False,
+    huge_tree=False
+)
+# Elements whose text never counts as page content; inline SVG icons can be large
+_NON_TEXT_TAGS = ('script', 'style', 'template', 'svg')
+_PAGE_CHROME_XPATH = etree.XPath('//nav | //header | //footer | //aside')
+_MAIN_CONTENT_XPATH = etree.XPath('(//main | //article)[1]')
+# Descendants with a "name" class (CSS .name), for team cards that don't use a heading
+_NAME_CLASS_XPATH = etree.XPath('(.//*[contains(concat(" ", normalize-space(@class), " "), " name ")])[1]')
+# Team member card selectors, in priority order:
+# .therapist, .team-member, .clinician, .staff-member, .practitioner,
+# [class*="team-"], [class*="therapist-"], [class*="clinician-"], [class*="staff-"]
+_TEAM_CARD_CLASSES = ('therapist', 'team-member', 'clinician', 'staff-member', 'practitioner')
+_TEAM_CARD_CLASS_PREFIXES = ('team-', 'therapist-', 'clinician-', 'staff-')
+# All selectors combined into one query so the tree is walked once
+_TEAM_CARD_XPATH = etree.XPath('//*[' + ' or '.join(
+    [f'contains(concat(" ", normalize-space(@class), " "), " {cls} ")' for cls in _TEAM_CARD_CLASSES]
+    + [f'contains(@class, "{prefix}")' for prefix in _TEAM_CARD_CLASS_PREFIXES]
+) + ']')
+
+
+def _parse_html(html: str) -> Optional[HtmlElement]:
+    """Parse page HTML into an lxml tree, or None if there is nothing to parse."""
+    try:
+        tree = lxml.html.document_fromstring(html.encode('utf-8'), parser=_HTML_PARSER)
+    except etree.ParserError:
+        return None
+
+    etree.strip_elements(tree, *_NON_TEXT_TAGS, with_tail=False)
+    return tree
+
+
+def _team_selector_rank(element: HtmlElement) -> int:
+    """Return the index of the highest-priority team selector the element matches."""
+    class_attr = element.get('class', '')
+    classes = class_attr.split()
+
+    for rank, cls in enumerate(_TEAM_CARD_CLASSES):
+        if cls in classes:
+            return rank
+
+    for rank, prefix in enumerate(_TEAM_CARD_CLASS_PREFIXES, len(_TEAM_CARD_CLASSES)):
+        if prefix in class_attr:
+            return rank
+
+    return len(_TEAM_CARD_CLASSES) + len(_TEAM_CARD_CLASS_PREFIXES)
+
+
+def _select_team_members(tree: HtmlElement) -> List[HtmlElement]:
+    """
+    Find team member cards with a single tree walk.
+
+    Matches are grouped by the highest-priority selector they satisfy, and only the best
+    group is returned - the same result as trying each selector in turn and stopping at
+    the first one that matches anything.
+    """
+    groups = {}
+    for element in _TEAM_CARD_XPATH(tree):
+        groups.setdefault(_team_selector_rank(element), []).append(element)
+
+    return groups[min(groups)] if groups else []
+
+
+def _stripped_text(element: HtmlElement) -> str:
+    """Concatenate the element's text fragments, each stripped of surrounding whitespace."""
+    return ''.join(fragment.strip() for fragment in element.itertext())
+
+
+def _only_string(element: HtmlElement) -> Optional[str]:
+    """Return the element's text if a single string is its only content, else None."""
+    while len(element) == 1 and not element.text and not element[0].tail:
+        element = element[0]
+
+    return element.text if len(element) == 0 else None
+
 
 def extract_therapists(html: str, page_url: str) -> List[Therapist]:
     """
@@ -22,37 +166,32 @@ def extract_therapists(html: str, page_url: str) -> List[Therapist]:
     Returns:
         List of Therapist objects
     """
-    import sys
-    print(f"DEBUG: extract_therapists called for: {page_url}", file=sys.stderr, flush=True)
+    logger.debug("extract_therapists called for: %s", page_url)
+
+    tree = _parse_html(html)
+    if tree is None:
+        return []
 
-    soup = BeautifulSoup(html, 'lxml')
     therapists = []
 
     # Get full text for directory detection
-    text_content = soup.get_text()
+    text_content = tree.text_content()
+
+    # Parse the URL once; the directory check and name-from-URL extraction both use it
+    parsed_url = urlparse(page_url)
 
     # Check if this is a generic directory page (should be skipped)
-    if _is_directory_page(soup, text_content, page_url):
-        print(f"DEBUG: Detected as directory page, skipping: {page_url}", file=sys.stderr, flush=True)
+    if _is_directory_page(tree, text_content, parsed_url):
+        logger.debug("Detected as directory page, skipping: %s", page_url)
         print(f"Skipping directory page: {page_url}")
         # Don't try to extract from directory pages - they should link to individual pages
         return []
 
-    print(f"DEBUG: Not a directory page, proceeding with extraction", file=sys.stderr, flush=True)
+    logger.debug("Not a directory page, proceeding with extraction")
 
     # Try to find multiple therapists (repeating pattern with structured cards)
     # Look for common class names
-    team_selectors = [
-        '.therapist', '.team-member', '.clinician', '.staff-member',
-        '.practitioner', '[class*="team-"]', '[class*="therapist-"]',
-        '[class*="clinician-"]', '[class*="staff-"]'
-    ]
-
-    team_members = []
-    for selector in team_selectors:
-        team_members = soup.select(selector)
-        if len(team_members) > 0:
-            break
+    team_members = _select_team_members(tree)
 
     if len(team_members) > 1:
         # Multiple structured therapist cards found - extract each
@@ -64,36 +203,42 @@ def extract_therapists(html: str, page_url: str) -> List[Therapist]:
     else:
         # Single therapist page or different structure
         # Try to extract from main content
-        print(f"DEBUG: Extracting from main content for single therapist", file=sys.stderr, flush=True)
-        therapist = _extract_from_main_content(soup, page_url)
+        logger.debug("Extracting from main content for single therapist")
+        therapist = _extract_from_main_content(tree, page_url, parsed_url)
         if therapist:
-            print(f"DEBUG: Successfully extracted therapist: {therapist.name}", file=sys.stderr, flush=True)
+            logger.debug("Successfully extracted therapist: %s", therapist.name)
             therapists.append(therapist)
         else:
-            print(f"DEBUG: Failed to extract therapist from main content", file=sys.stderr, flush=True)
+            logger.debug("Failed to extract therapist from main content")
 
-    print(f"DEBUG: Returning {len(therapists)} therapist(s)", file=sys.stderr, flush=True)
+    logger.debug("Returning %d therapist(s)", len(therapists))
     return therapists
 
 
-def _extract_single_therapist(element, page_url: str) -> Optional[Therapist]:
+def _extract_single_therapist(element: HtmlElement, page_url: str) -> Optional[Therapist]:
     """Extract therapist info from a single HTML element."""
     try:
-        # Find name (usually in h2, h3, h4, or strong tag)
-        name_elem = element.find(['h2', 'h3', 'h4', 'h5', 'strong', '.name'])
-        if name_elem:
-            name = name_elem.get_text(strip=True)
+        # Stringify the card once and reuse it below
+        element_text = element.text_content()
+
+        # Find name (usually in h2, h3, h4, or strong tag, otherwise an element with a .name class)
+        name_elem = next(element.iterdescendants('h2', 'h3', 'h4', 'h5', 'strong'), None)
+        if name_elem is None:
+            name_elem = next(iter(_NAME_CLASS_XPATH(element)), None)
+
+        if name_elem is not None:
+            name = _stripped_text(name_elem)
         else:
             # Fallback: use first text content that looks like a name
-            text = element.get_text(strip=True)
+            text = _stripped_text(element)
             lines = [l.strip() for l in text.split('\n') if l.strip()]
             name = lines[0] if lines else "Unknown"
 
         # Extract credentials
-        credentials = _extract_credentials(element.get_text())
+        credentials = _extract_credentials(element_text)
 
         # Get bio text (all text content, cleaned)
-        bio_text = _clean_text(element.get_text())
+        bio_text = _clean_text(element_text)
 
         if bio_text and len(bio_text) > 50:  # Minimum bio length
             return Therapist(
@@ -108,68 +253,72 @@ def _extract_single_therapist(element, page_url: str) -> Optional[Therapist]:
     return None
 
 
-def _extract_from_main_content(soup: BeautifulSoup, page_url: str) -> Optional[Therapist]:
+def _extract_from_main_content(tree: HtmlElement, page_url: str, parsed_url: ParseResult) -> Optional[Therapist]:
     """Extract therapist info from main content area (single therapist site)."""
-    import sys
-    print(f"DEBUG: _extract_from_main_content called", file=sys.stderr, flush=True)
+    logger.debug("_extract_from_main_content called")
     try:
         # Remove nav, footer, header, sidebar
-        for tag in soup.find_all(['nav', 'header', 'footer', 'aside']):
-            tag.decompose()
+        for tag in _PAGE_CHROME_XPATH(tree):
+            tag.drop_tree()
 
         # Look for main content area
-        main_content = soup.find(['main', 'article', '[role="main"]', '#content', '.content'])
+        main_content = next(iter(_MAIN_CONTENT_XPATH(tree)), None)
 
-        if not main_content:
-            main_content = soup.find('body')
+        if main_content is None:
+            main_content = tree.find('.//body')
 
-        if not main_content:
-            print(f"DEBUG: No main content found", file=sys.stderr, flush=True)
+        if main_content is None:
+            logger.debug("No main content found")
             return None
 
-        # Get text content for analysis
-        text_content = main_content.get_text()
-        print(f"DEBUG: Text content length: {len(text_content)} chars", file=sys.stderr, flush=True)
+        # Get text content for analysis (computed once, reused by every step below)
+        text_content = main_content.text_content()
+        text_lower = text_content.casefold()
+        logger.debug("Text content length: %d chars", len(text_content))
 
-        # FIRST: Check if this is a directory page - if so, skip it
-        if _is_directory_page(soup, text_content, page_url):
-            print(f"DEBUG: _is_directory_page returned True, skipping", file=sys.stderr, flush=True)
-            print(f"Detected directory page, skipping: {page_url}")
-            return None
+        # Directory detection already ran in extract_therapists on the full page; the main
+        # content is a subset of it, so a second check here could never reject the page
 
-        print(f"DEBUG: Not a directory page, continuing", file=sys.stderr, flush=True)
+        # One pass over the text for names followed by credentials, shared by the name
+        # extraction strategies below
+        credentialed_names = _extract_credentialed_names(text_content)
 
-        # SECOND: Try to extract name from URL (most reliable for individual pages)
-        name_from_url = _extract_name_from_url(page_url)
-        print(f"DEBUG: name_from_url = {name_from_url}", file=sys.stderr, flush=True)
+        # FIRST: Try to extract name from URL (most reliable for individual pages)
+        name_from_url = _extract_name_from_url(parsed_url)
+        logger.debug("name_from_url = %s", name_from_url)
 
         if name_from_url:
             # Validate that this name is the page owner
-            is_owner = _validate_name_is_page_owner(name_from_url, soup, text_content)
-            print(f"DEBUG: _validate_name_is_page_owner returned {is_owner}", file=sys.stderr, flush=True)
+            is_owner = _validate_name_is_page_owner(name_from_url, tree, text_lower)
+            logger.debug("_validate_name_is_page_owner returned %s", is_owner)
             if is_owner:
                 print(f"Extracted name from URL: {name_from_url}")
                 name = name_from_url
             else:
                 # URL had a name but it doesn't match page content
                 # Fall back to content extraction
-                name = _extract_therapist_name(soup, main_content, text_content, page_url)
-                print(f"DEBUG: Fallback name extraction returned: {name}", file=sys.stderr, flush=True)
+                name = _extract_therapist_name(
+                    tree, main_content, text_content, text_lower, credentialed_names, page_url
+                )
+                logger.debug("Fallback name extraction returned: %s", name)
         else:
             # No name in URL, extract from content
-            name = _extract_therapist_name(soup, main_content, text_content, page_url)
-            print(f"DEBUG: Name from content: {name}", file=sys.stderr, flush=True)
+            name = _extract_therapist_name(
+                tree, main_content, text_content, text_lower, credentialed_names, page_url
+            )
+            logger.debug("Name from content: %s", name)
 
-        # Extract credentials
+        # Extract credentials from the whole text; this already covers the ones listed
+        # after a name, plus those mentioned elsewhere (e.g. "EMDR certified")
         credentials = _extract_credentials(text_content)
-        print(f"DEBUG: Extracted credentials: {credentials}", file=sys.stderr, flush=True)
+        logger.debug("Extracted credentials: %s", credentials)
 
         # Get bio text
         bio_text = _clean_text(text_content)
-        print(f"DEBUG: Bio text length: {len(bio_text) if bio_text else 0} chars", file=sys.stderr, flush=True)
+        logger.debug("Bio text length: %d chars", len(bio_text) if bio_text else 0)
 
         if bio_text and len(bio_text) > 100:
-            print(f"DEBUG: Bio text length check passed, creating Therapist object", file=sys.stderr, flush=True)
+            logger.debug("Bio text length check passed, creating Therapist object")
             return Therapist(
                 name=name,
                 credentials=credentials,
@@ -182,44 +331,65 @@ def _extract_from_main_content(soup: BeautifulSoup, page_url: str) -> Optional[T
     return None
 
 
-def _extract_therapist_name(soup: BeautifulSoup, main_content, text_content: str, page_url: str) -> str:
+def _extract_therapist_name(
+    tree: HtmlElement,
+    main_content,
+    text_content: str,
+    text_lower: str,
+    credentialed_names: List[str],
+    page_url: str
+) -> str:
     """
     Extract therapist name using multiple strategies, prioritizing most reliable sources.
 
+    credentialed_names are the names found followed by credentials, from
+    _extract_credentialed_names.
+
     Returns the most likely name or "Unknown Therapist" if none found.
     """
+    # Collect every candidate element up front - one walk of the main content for headings
+    # and one of the document for the title and author meta - instead of a search per strategy
+    # (an XPath union would still walk the tree once per branch)
+    headings = {'h1': [], 'h2': [], 'h3': []}
+    for heading in main_content.iterdescendants('h1', 'h2', 'h3'):
+        headings[heading.tag].append(heading)
+
+    title = meta_name = None
+    for element in tree.iter('title', 'meta'):
+        if element.tag == 'title':
+            if title is None:
+                title = element
+        elif meta_name is None and element.get('name') == 'author':
+            meta_name = element
+
+        if title is not None and meta_name is not None:
+            break
+
     # Strategy 1: Check H1 (highest priority - usually contains page subject)
-    h1 = main_content.find('h1')
-    if h1:
-        h1_text = h1.get_text(strip=True)
+    h1 = headings['h1'][0] if headings['h1'] else None
+    if h1 is not None:
+        h1_text = _stripped_text(h1)
         # Clean common prefixes
-        h1_text = re.sub(r'^(About|Meet|Dr\.?|Mr\.?|Ms\.?|Mrs\.?)\s+', '', h1_text, flags=re.IGNORECASE)
+        h1_text = _HEADING_PREFIX_RE.sub('', h1_text)
         if _looks_like_person_name(h1_text):
-            if _validate_name_is_page_owner(h1_text, soup, text_content):
+            if _validate_name_is_page_owner(h1_text, tree, text_lower):
                 return h1_text
 
     # Strategy 2: Check page title
-    title = soup.find('title')
-    if title:
-        title_text = title.get_text(strip=True)
+    if title is not None:
+        title_text = _stripped_text(title)
         # Try to extract name from title (e.g., "About Dr. Jane Doe | Therapy")
-        name_in_title = re.search(r'(?:About|Meet|Dr\.?|)\s*([A-Z][a-z]+\s+[A-Z][a-z]+)', title_text)
+        name_in_title = _TITLE_NAME_RE.search(title_text)
         if name_in_title:
             potential_name = name_in_title.group(1).strip()
             if _looks_like_person_name(potential_name):
-                if _validate_name_is_page_owner(potential_name, soup, text_content):
+                if _validate_name_is_page_owner(potential_name, tree, text_lower):
                     return potential_name
 
     # Strategy 3: Look for patterns like "I'm [Name]" or "My name is [Name]"
     # (High confidence - first person identification)
-    intro_patterns = [
-        r"I'm\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2})",
-        r"I am\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2})",
-        r"My name is\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2})",
-    ]
-
-    for pattern in intro_patterns:
-        match = re.search(pattern, text_content)
+    for pattern in _INTRO_PATTERNS:
+        match = pattern.search(text_content)
         if match:
             potential_name = match.group(1).strip()
             if _looks_like_person_name(potential_name):
@@ -227,64 +397,101 @@ def _extract_therapist_name(soup: BeautifulSoup, main_content, text_content: str
 
     # Strategy 4: Look for names with credentials nearby (but validate it's the page owner)
     # Pattern like "Jane Doe, LCSW, PhD" or "John Smith MA, LPC"
-    name_with_creds_pattern = r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3})\s*[,\s]+([A-Z]{2,6}(?:[,\s]+[A-Z]{2,6})*)'
-    matches = re.findall(name_with_creds_pattern, text_content)
-
     # Check each match and validate it's the page owner
-    for match in matches:
-        potential_name = match[0].strip()
+    for potential_name in credentialed_names:
         if _looks_like_person_name(potential_name):
             # Only use this name if it appears to be the page owner
-            if _validate_name_is_page_owner(potential_name, soup, text_content):
+            if _validate_name_is_page_owner(potential_name, tree, text_lower):
                 return potential_name
             # If first person language exists, use first match even without validation
-            elif _has_first_person_language(text_content):
+            elif _has_first_person_language(text_lower):
                 return potential_name
 
     # Strategy 5: Check meta tags for author/name
-    meta_name = soup.find('meta', attrs={'name': 'author'})
-    if meta_name and meta_name.get('content'):
-        potential_name = meta_name['content'].strip()
+    if meta_name is not None and meta_name.get('content'):
+        potential_name = meta_name.get('content').strip()
         if _looks_like_person_name(potential_name):
             return potential_name
 
     # Strategy 6: Look for h2 tags that look like names (with validation)
     for heading_tag in ['h2', 'h3']:
-        headings = main_content.find_all(heading_tag)
-        for heading in headings:
-            text = heading.get_text(strip=True)
-            text = re.sub(r'^(About|Meet|Dr\.?|Mr\.?|Ms\.?|Mrs\.?)\s+', '', text, flags=re.IGNORECASE)
+        for heading in headings[heading_tag]:
+            text = _stripped_text(heading)
+            text = _HEADING_PREFIX_RE.sub('', text)
             if _looks_like_person_name(text):
-                if _validate_name_is_page_owner(text, soup, text_content):
+                if _validate_name_is_page_owner(text, tree, text_lower):
                     return text
 
     # Fallback
     return "Unknown Therapist"
 
 
-def _is_directory_page(soup: BeautifulSoup, text_content: str, page_url: str) -> bool:
+def _is_directory_page(tree: HtmlElement, text_content: str, parsed_url: ParseResult) -> bool:
     """
     Detect if this is a directory/team page listing multiple therapists.
 
     Directory pages should be skipped or handled differently than individual pages.
+    Checks run cheapest first - URL, then page structure, then a regex sweep of the
+    full text - and stop at the first one that flags the page.
 
     Returns True if this appears to be a directory page.
     """
-    import sys
+    if _is_directory_url(parsed_url):
+        return True
 
-    # Check 1: URL is generic (/about, /team, /staff, /our-therapists)
-    url_path = urlparse(page_url).path.lower().strip('/')
-    generic_paths = ['about', 'team', 'staff', 'our-team', 'our-therapists',
-                     'our-staff', 'clinicians', 'therapists', 'meet-the-team']
+    if _has_directory_structure(tree):
+        return True
 
-    print(f"DEBUG: Directory check 1 - url_path='{url_path}', in generic_paths={url_path in generic_paths}", file=sys.stderr, flush=True)
-    if url_path in generic_paths:
-        print(f"DEBUG: Failed check 1 - generic path", file=sys.stderr, flush=True)
+    if _has_many_credentialed_names(text_content):
         return True
 
-    # Check 2: Multiple names with credentials (5+ suggests directory)
-    name_cred_pattern = r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3})\s*[,\s]+([A-Z]{2,6}(?:[,\s]+[A-Z]{2,6})*)'
-    matches = re.findall(name_cred_pattern, text_content)
+    logger.debug("Passed all directory checks - this is an individual page")
+
+    return False
+
+
+def _is_directory_url(parsed_url: ParseResult) -> bool:
+    """Check if the URL is a generic listing path (/about, /team, /staff, /our-therapists)."""
+    url_path = parsed_url.path.lower().strip('/')
+
+    logger.debug("Directory URL check - url_path='%s', in generic_paths=%s", url_path, url_path in _GENERIC_PATHS)
+    if url_path in _GENERIC_PATHS:
+        logger.debug("Failed URL check - generic path")
+        return True
+
+    return False
+
+
+def _has_directory_structure(tree: HtmlElement) -> bool:
+    """Check for repeated "Learn more" links or team member containers."""
+    # Multiple "Learn more" or "Read bio" links (common in directories)
+    learn_more_links = 0
+    for link in tree.iter('a'):
+        if _LEARN_MORE_RE.search(_only_string(link) or ''):
+            learn_more_links += 1
+            if learn_more_links >= 3:
+                logger.debug("Failed structure check - multiple learn more links")
+                return True
+
+    # Repeating structural patterns (multiple team member cards)
+    team_containers = 0
+    for container in tree.iter('div', 'article'):
+        if _TEAM_CLASS_RE.search(container.get('class', '')):
+            team_containers += 1
+            if team_containers >= 3:
+                logger.debug("Failed structure check - multiple team containers")
+                return True
+
+    logger.debug(
+        "Directory structure check - found %d learn more links, %d team containers",
+        learn_more_links, team_containers
+    )
+    return False
+
+
+def _has_many_credentialed_names(text_content: str) -> bool:
+    """Check for multiple distinct names followed by credentials (5+ suggests a directory)."""
+    matches = _NAME_CRED_RE.findall(text_content)
 
     # Extract unique potential names
     unique_names = set()
@@ -292,40 +499,24 @@ def _is_directory_page(soup: BeautifulSoup, text_content: str, page_url: str) ->
         name = match[0].strip()
 
         # Clean the name: remove newlines, extra whitespace, and trailing garbage
-        name = re.sub(r'\s+', ' ', name)  # Normalize whitespace
-        name = re.split(r'\n', name)[0]  # Take only first line if multiline
+        name = _WS_RE.sub(' ', name)  # Normalize whitespace
+        name = name.split('\n')[0]  # Take only first line if multiline
         name = name.strip()
 
         # Only consider if it looks like a person name
         if _looks_like_person_name(name):
             unique_names.add(name)
 
-    print(f"DEBUG: Directory check 2 - found {len(unique_names)} unique names with credentials", file=sys.stderr, flush=True)
+    logger.debug("Directory names check - found %d unique names with credentials", len(unique_names))
     # Increase threshold to 5 to avoid false positives from city names, institutions, etc.
     if len(unique_names) >= 5:
-        print(f"DEBUG: Failed check 2 - multiple names: {list(unique_names)[:5]}", file=sys.stderr, flush=True)
-        return True
-
-    # Check 3: Multiple "Learn more" or "Read bio" links (common in directories)
-    learn_more_links = soup.find_all('a', string=re.compile(r'(learn more|read more|read bio|view profile|meet)', re.IGNORECASE))
-    print(f"DEBUG: Directory check 3 - found {len(learn_more_links)} learn more links", file=sys.stderr, flush=True)
-    if len(learn_more_links) >= 3:
-        print(f"DEBUG: Failed check 3 - multiple learn more links", file=sys.stderr, flush=True)
-        return True
-
-    # Check 4: Repeating structural patterns (multiple team member cards)
-    team_containers = soup.find_all(['div', 'article'], class_=re.compile(r'(team|staff|clinician|therapist|member)', re.IGNORECASE))
-    print(f"DEBUG: Directory check 4 - found {len(team_containers)} team containers", file=sys.stderr, flush=True)
-    if len(team_containers) >= 3:
-        print(f"DEBUG: Failed check 4 - multiple team containers", file=sys.stderr, flush=True)
+        logger.debug("Failed names check - multiple names: %s", list(unique_names)[:5])
         return True
 
-    print(f"DEBUG: Passed all directory checks - this is an individual page", file=sys.stderr, flush=True)
-
     return False
 
 
-def _extract_name_from_url(page_url: str) -> Optional[str]:
+def _extract_name_from_url(parsed_url: ParseResult) -> Optional[str]:
     """
     Extract therapist name from URL path.
 
@@ -337,7 +528,7 @@ def _extract_name_from_url(page_url: str) -> Optional[str]:
 
     Returns None if no name found in URL.
     """
-    url_path = urlparse(page_url).path.strip('/')
+    url_path = parsed_url.path.strip('/')
 
     # Get the last part of the path (most specific)
     path_parts = url_path.split('/')
@@ -347,8 +538,7 @@ def _extract_name_from_url(page_url: str) -> Optional[str]:
         return None
 
     # Remove common prefixes
-    prefixes = ['about-', 'meet-', 'dr-', 'doctor-', 'therapist-']
-    for prefix in prefixes:
+    for prefix in _URL_NAME_PREFIXES:
         if last_part.startswith(prefix):
             last_part = last_part[len(prefix):]
             break
@@ -358,8 +548,7 @@ def _extract_name_from_url(page_url: str) -> Optional[str]:
     name_parts = last_part.replace('_', '-').split('-')
 
     # Filter out common URL words
-    stop_words = ['and', 'the', 'of', 'at', 'in', 'on', 'for', 'to']
-    name_parts = [part for part in name_parts if part.lower() not in stop_words]
+    name_parts = [part for part in name_parts if part.lower() not in _URL_STOP_WORDS]
 
     # Capitalize each part
     name_parts = [part.capitalize() for part in name_parts if part]
@@ -373,22 +562,20 @@ def _extract_name_from_url(page_url: str) -> Optional[str]:
     return None
 
 
-def _has_first_person_language(text_content: str) -> bool:
+def _has_first_person_language(text_lower: str) -> bool:
     """
     Check if the page uses first-person language (suggests individual page).
 
+    Expects casefolded page text.
+
     Returns True if first-person pronouns are found.
     """
-    # Look for first-person pronouns
-    first_person_pattern = r'\b(I am|I\'m|I have|I\'ve|I specialize|I work|I help|my practice|my approach|my background)\b'
-
-    matches = re.findall(first_person_pattern, text_content, re.IGNORECASE)
+    # Look for first-person pronouns; need at least 2 instances to be confident
+    matches = _FIRST_PERSON_RE.finditer(text_lower)
+    return sum(1 for _ in islice(matches, 2)) >= 2
 
-    # Need at least 2 instances to be confident
-    return len(matches) >= 2
 
-
-def _validate_name_is_page_owner(name: str, soup: BeautifulSoup, text_content: str) -> bool:
+def _validate_name_is_page_owner(name: str, tree: HtmlElement, text_lower: str) -> bool:
     """
     Validate that the extracted name is the page owner, not just mentioned.
 
@@ -397,28 +584,31 @@ def _validate_name_is_page_owner(name: str, soup: BeautifulSoup, text_content: s
     - Name appears multiple times
     - First-person language near the name
 
+    text_lower is the casefolded page text, computed once per page by the caller.
+
     Returns True if name is likely the page owner.
     """
     if not name:
         return False
 
+    name_lower = name.casefold()
+
     # Check 1: Name in H1
-    h1 = soup.find('h1')
-    if h1 and name.lower() in h1.get_text().lower():
+    h1 = tree.find('.//h1')
+    if h1 is not None and name_lower in h1.text_content().casefold():
         return True
 
     # Check 2: Name in page title
-    title = soup.find('title')
-    if title and name.lower() in title.get_text().lower():
+    title = tree.find('.//title')
+    if title is not None and name_lower in title.text_content().casefold():
         return True
 
     # Check 3: Name appears multiple times (page owner mentioned throughout)
-    name_occurrences = len(re.findall(re.escape(name), text_content, re.IGNORECASE))
-    if name_occurrences >= 3:
+    if text_lower.count(name_lower) >= 3:
         return True
 
     # Check 4: First-person language exists on page
-    if _has_first_person_language(text_content):
+    if _has_first_person_language(text_lower):
         return True
 
     return False
@@ -440,7 +630,7 @@ def _looks_like_person_name(text: str) -> bool:
         return False
 
     # Remove common prefixes
-    text = re.sub(r'^(Dr\.?|Mr\.?|Ms\.?|Mrs\.?|Miss)\s+', '', text, flags=re.IGNORECASE)
+    text = _HONORIFIC_PREFIX_RE.sub('', text)
 
     # Check for disqualifying patterns
     if '?' in text or '!' in text:
@@ -455,71 +645,58 @@ def _looks_like_person_name(text: str) -> bool:
         return False
 
     # Check for generic therapy-related words
-    generic_terms = [
-        'therapist', 'counselor', 'psychologist', 'psychiatrist',
-        'therapy', 'counseling', 'psychotherapy', 'services',
-        'about', 'welcome', 'home', 'contact', 'why', 'how', 'what',
-        'our', 'team', 'staff', 'practice', 'clinic', 'center'
-    ]
-
-    text_lower = text.lower()
-    if any(term in text_lower for term in generic_terms):
+    text_lower = text.casefold()
+    if _GENERIC_TERMS_RE.search(text_lower) is not None:
         return False
 
     # Filter out location names
     # Common directional prefixes
-    if words[0].lower() in ['east', 'west', 'north', 'south', 'new']:
+    if words[0].lower() in _DIRECTIONAL_WORDS:
         return False
 
     # Common location words
-    location_terms = [
-        'saint', 'st.', 'san', 'santa', 'port', 'mount', 'fort',
-        'lake', 'city', 'beach', 'river', 'bay', 'valley', 'springs',
-        'hills', 'heights', 'park', 'grove', 'point', 'island',
-        'college', 'university', 'hospital', 'center', 'institute'
-    ]
-    if any(term in text_lower for term in location_terms):
+    if _LOCATION_TERMS_RE.search(text_lower) is not None:
         return False
 
     # Must start with capital letter and contain at least one more capital (for last name)
-    if not re.match(r'^[A-Z][a-z]+\s+[A-Z]', text):
+    if not _PERSON_NAME_SHAPE_RE.match(text):
         return False
 
     return True
 
 
+def _extract_credentialed_names(text: str) -> List[str]:
+    """
+    Find names followed by credentials in a single regex pass.
+
+    Args:
+        text: Text to search
+
+    Returns:
+        Candidate names in page order
+    """
+    return [name.strip() for name, _ in _NAME_CRED_RE.findall(text)]
+
+
 def _extract_credentials(text: str) -> Optional[str]:
     """Extract credentials from text (e.g., LCSW, PhD, PsyD)."""
-    # Common therapy credentials
-    credential_pattern = r'\b([A-Z]{2,6}(?:-[A-Z]+)?)\b'
-    common_credentials = [
-        'LCSW', 'LMFT', 'LMHC', 'PHD', 'PSYD', 'MD', 'LCSW-C',
-        'LPC', 'LPCC', 'LCPC', 'MSW', 'MA', 'MS', 'CADC', 'NCC',
-        'LICSW', 'LISW', 'LCMHC', 'LCAT', 'ATR', 'RN', 'PMHNP',
-        'CST', 'ACS', 'ACSW', 'LCADC', 'CAADC', 'CSAC', 'LMHP'
-    ]
-
-    found_credentials = []
-    matches = re.findall(credential_pattern, text)
-
-    for match in matches:
-        if match.upper() in common_credentials:
-            found_credentials.append(match.upper())
+    # Single pass over the matches; the set removes duplicates
+    found_credentials = {
+        match.upper() for match in _CRED_RE.findall(text)
+        if match.upper() in _COMMON_CREDENTIALS
+    }
 
-    # Remove duplicates and return as comma-separated string
     if found_credentials:
-        return ', '.join(sorted(set(found_credentials)))
+        return ', '.join(sorted(found_credentials))
 
     return None
 
 
 def _clean_text(text: str) -> str:
     """Clean and normalize text content."""
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
-    # Remove leading/trailing whitespace
-    text = text.strip()
-    return text
+    # Collapse whitespace runs and trim the ends; split() with no argument
+    # splits on the same characters as \s+
+    return ' '.join(text.split())
 
 
 def extract_specialty(html: str, page_url: str) -> Optional[Specialty]:
@@ -533,25 +710,27 @@ def extract_specialty(html: str, page_url: str) -> Optional[Specialty]:
     Returns:
         Specialty object or None
     """
-    soup = BeautifulSoup(html, 'lxml')
+    tree = _parse_html(html)
+    if tree is None:
+        return None
 
     try:
         # Remove nav, footer, header, sidebar
-        for tag in soup.find_all(['nav', 'header', 'footer', 'aside']):
-            tag.decompose()
+        for tag in _PAGE_CHROME_XPATH(tree):
+            tag.drop_tree()
 
         # Extract specialty name from title or h1
         name = None
 
         # Try h1 first
-        h1 = soup.find('h1')
-        if h1:
-            name = h1.get_text(strip=True)
+        h1 = tree.find('.//h1')
+        if h1 is not None:
+            name = _stripped_text(h1)
         else:
             # Try page title
-            title = soup.find('title')
-            if title:
-                name = title.get_text(strip=True)
+            title = tree.find('.//title')
+            if title is not None:
+                name = _stripped_text(title)
 
         # Fallback: extract from URL
         if not name:
@@ -560,12 +739,12 @@ def extract_specialty(html: str, page_url: str) -> Optional[Specialty]:
             name = url_parts[-1].replace('-', ' ').replace('_', ' ').title()
 
         # Extract main content
-        main_content = soup.find(['main', 'article', '[role="main"]', '#content', '.content'])
+        main_content = next(iter(_MAIN_CONTENT_XPATH(tree)), None)
 
-        if not main_content:
-            main_content = soup.find('body')
+        if main_content is None:
+            main_content = tree.find('.//body')
 
-        content = _clean_text(main_content.get_text()) if main_content else ""
+        content = _clean_text(main_content.text_content()) if main_content is not None else ""
 
         if name and content and len(content) > 100:
             return Specialty(
@@ -0,0 +1,143 @@
+"""On-disk cache of fetched HTTP response bodies with ETag/Last-Modified validators."""
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+
+class HttpCache:
+    """
+    Stores response bodies by URL for conditional re-fetching.
+
+    Entries younger than the TTL can be used without a request. Older entries keep their
+    validators, so the caller can revalidate with If-None-Match / If-Modified-Since and
+    reuse the cached body when the server answers 304 Not Modified.
+    """
+
+    def __init__(self, cache_dir, ttl: float):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding a .body and a .json metadata file per URL
+            ttl: Seconds an entry is served without revalidation
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+
+    @staticmethod
+    def make_key(url: str) -> str:
+        """
+        Hash a URL into a cache key.
+
+        Args:
+            url: Requested URL
+
+        Returns:
+            32-character hex digest of the URL
+        """
+        return hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+
+    def get(self, url: str) -> Optional[dict]:
+        """
+        Look up a cached response.
+
+        Args:
+            url: Requested URL
+
+        Returns:
+            Dict with 'body', 'etag', 'last_modified', 'encoding' and 'fetched_at',
+            or None on a miss
+        """
+        path = self.cache_dir / self.make_key(url)
+        try:
+            with open(path.with_suffix('.json'), encoding='utf-8') as f:
+                entry = json.load(f)
+            entry['body'] = path.with_suffix('.body').read_bytes()
+        except (OSError, ValueError):
+            return None
+
+        return entry if isinstance(entry.get('fetched_at'), (int, float)) else None
+
+    def is_fresh(self, entry: dict) -> bool:
+        """Return True if an entry is young enough to use without revalidating."""
+        return time.time() - entry['fetched_at'] < self.ttl
+
+    @staticmethod
+    def validator_headers(entry: Optional[dict]) -> dict:
+        """
+        Build conditional request headers from a cached entry.
+
+        Args:
+            entry: Entry from get(), or None
+
+        Returns:
+            If-None-Match / If-Modified-Since headers (empty if there's nothing to send)
+        """
+        headers = {}
+        if entry is not None:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def set(
+        self,
+        url: str,
+        body: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        encoding: Optional[str] = None
+    ):
+        """
+        Store a response body and its validators.
+
+        Args:
+            url: Requested URL
+            body: Raw response body
+            etag: ETag response header, if any
+            last_modified: Last-Modified response header, if any
+            encoding: Character encoding of the body, if known
+        """
+        path = self.cache_dir / self.make_key(url)
+        metadata = json.dumps({
+            'etag': etag,
+            'last_modified': last_modified,
+            'encoding': encoding,
+            'fetched_at': time.time()
+        })
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Body first, then metadata, so metadata never points at a body that isn't there
+        self._write_atomic(path.with_suffix('.body'), body)
+        self._write_atomic(path.with_suffix('.json'), metadata.encode('utf-8'))
+
+    def delete(self, url: str):
+        """
+        Remove a URL's cached response, if present.
+
+        Args:
+            url: Requested URL
+        """
+        path = self.cache_dir / self.make_key(url)
+        for suffix in ('.json', '.body'):
+            try:
+                os.remove(path.with_suffix(suffix))
+            except FileNotFoundError:
+                pass
+
+    def _write_atomic(self, path: Path, data: bytes):
+        """Write to a temp file and rename so concurrent readers never see a partial file."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
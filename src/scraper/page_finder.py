@@ -1,9 +1,21 @@
 """Find therapist and specialty pages on therapy websites using AI classification."""
+import logging
 import re
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
 from urllib.parse import urlparse
+import lxml.html
+from lxml import etree
+from lxml.html import HtmlElement
 from .sitemap_parser import fetch_sitemap_urls, crawl_homepage_links
 from .url_classifier import classify_urls_with_ai
+from .url_validator import url_netloc
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Paths that are clearly a therapist bio (/team/jane-doe) or a specialty page (/anxiety-therapy)
+_THERAPIST_PATH_RE = re.compile(r'^/(team|staff|therapists|clinicians|providers|about)/[a-z]+[-_][a-z]+/?$')
+_SPECIALTY_PATH_RE = re.compile(r'^/[a-z-]+(therapy|counseling|treatment)/?$')
 
 
 def find_pages_intelligently(
@@ -22,33 +34,66 @@ def find_pages_intelligently(
     Returns:
         Tuple of (therapist_urls, specialty_urls)
     """
-    print("\n[DISCOVERY] Discovering pages intelligently...")
+    logger.info("Discovering pages intelligently...")
 
     # Step 1: Get all URLs from sitemap or homepage
     urls = fetch_sitemap_urls(base_url)
 
     if not urls:
         # Fallback: crawl homepage for links
-        print("[DISCOVERY] No sitemap found, crawling homepage...")
+        logger.info("No sitemap found, crawling homepage...")
         urls = crawl_homepage_links(base_url)
 
     if not urls:
-        print("[ERROR] Could not discover any URLs")
+        logger.error("Could not discover any URLs")
         return [], []
 
-    # Step 2: Use AI to classify URLs
-    classified = classify_urls_with_ai(urls, api_key, base_url)
+    # Step 2: Classify obvious URLs locally, and only send the rest to AI
+    therapist_urls, specialty_urls, unknown_urls = _fast_classify(urls)
+    logger.info(
+        "Matched %d therapist and %d specialty URL(s) locally, %d left for AI",
+        len(therapist_urls), len(specialty_urls), len(unknown_urls)
+    )
 
-    therapist_urls = classified.get('therapist_pages', [])
-    specialty_urls = classified.get('specialty_pages', [])
+    if unknown_urls:
+        classified = classify_urls_with_ai(unknown_urls, api_key, base_url)
+        therapist_urls += classified.get('therapist_pages', [])
+        specialty_urls += classified.get('specialty_pages', [])
 
-    print(f"\n[OK] Intelligent discovery complete:")
-    print(f"  - Found {len(therapist_urls)} therapist page(s)")
-    print(f"  - Found {len(specialty_urls)} specialty page(s)")
+    logger.info(
+        "Intelligent discovery complete: %d therapist page(s), %d specialty page(s)",
+        len(therapist_urls), len(specialty_urls)
+    )
 
     return therapist_urls, specialty_urls
 
 
+def _fast_classify(urls: List[str]) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Classify URLs whose paths follow unmistakable therapist or specialty patterns.
+
+    Args:
+        urls: Discovered URLs
+
+    Returns:
+        Tuple of (therapist_urls, specialty_urls, unknown_urls)
+    """
+    therapist_urls = []
+    specialty_urls = []
+    unknown_urls = []
+
+    for url in urls:
+        path = urlparse(url).path.lower()
+        if _THERAPIST_PATH_RE.match(path):
+            therapist_urls.append(url)
+        elif _SPECIALTY_PATH_RE.match(path):
+            specialty_urls.append(url)
+        else:
+            unknown_urls.append(url)
+
+    return therapist_urls, specialty_urls, unknown_urls
+
+
 # Legacy functions - kept for backward compatibility
 # These now internally use the intelligent approach
 
@@ -101,46 +146,118 @@ def find_specialty_pages(html: str, base_url: str, api_key: str = None) -> List[
 
 # Legacy implementations (only used as fallback)
 
-def _find_therapist_pages_legacy(html: str, base_url: str) -> List[str]:
-    """Legacy pattern-based therapist page finder (fallback only)."""
-    from bs4 import BeautifulSoup
+_LINK_PARSER = lxml.html.HTMLParser(encoding='utf-8', remove_comments=True, collect_ids=False)
+
+
+# Legacy page-finder patterns, compiled once at import. Each keyword list becomes a single
+# alternation so a string is scanned once per category instead of once per keyword.
+_THERAPY_URL_RE = re.compile(r'/[\w-]+-therapy/?$')
+_COUNSELING_URL_RE = re.compile(r'/[\w-]+-counseling/?$')
+_TREATMENT_URL_RE = re.compile(r'/[\w-]+-treatment/?$')
+
+
+def _keyword_pattern(keywords: List[str]) -> re.Pattern:
+    """Compile keywords into one regex that matches wherever any of them appears."""
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+
+_SERVICE_KEYWORDS_RE = _keyword_pattern(['service', 'specialty', 'specialize', 'treatment', 'help'])
+_NAV_KEYWORDS_RE = _keyword_pattern(
+    ['service', 'specialty', 'specialties', 'offering', 'offerings', 'we help', 'conditions']
+)
+_SPECIALTY_INDICATORS_RE = _keyword_pattern([
+    'therapy', 'counseling', 'treatment', 'anxiety', 'depression',
+    'trauma', 'emdr', 'couples', 'family', 'individual', 'grief',
+    'addiction', 'ptsd', 'ocd'
+])
+_EXCLUDED_KEYWORDS_RE = _keyword_pattern([
+    'contact', 'about', 'team', 'blog', 'privacy', 'terms',
+    'faq', 'insurance', 'fees', 'location', 'directions', 'schedule'
+])
+
+# Paths probed on every site by the legacy therapist page finder
+_COMMON_TEAM_PATHS = (
+    '/team', '/about', '/therapists', '/clinicians',
+    '/meet-the-team', '/our-team', '/staff', '/meet-our-therapists',
+    '/about-us', '/our-therapists', '/our-clinicians', '/providers'
+)
+_THERAPIST_NAV_KEYWORDS_RE = _keyword_pattern(
+    ['team', 'about', 'therapist', 'clinician', 'staff', 'provider', 'meet', 'bio']
+)
+_HOMEPAGE_PATHS = frozenset({'', '/', '/index', '/index.html', '/home'})
+# Root-relative hrefs that urljoin would rewrite (protocol-relative, dot segments, empty
+# query/fragment/params, embedded tabs or newlines) and so can't be joined by concatenation
+_NEEDS_URLJOIN_RE = re.compile(r'^//|/\.|[?#;\t\n\r]')
+# Query parameters added by analytics/ad links that don't change which page is served
+_TRACKING_PARAM_RE = re.compile(r'(?:utm_[^=&]*|fbclid|gclid|dclid|msclkid|mc_cid|mc_eid|_ga|_gl)(?:=|$)', re.IGNORECASE)
+
+
+def _iter_page_links(html: str, base_url: str) -> Iterator[Tuple[HtmlElement, str]]:
+    """
+    Yield each <a href> element on a page with its absolute URL.
+
+    Uses lxml's native link iteration instead of a BeautifulSoup tree.
+    """
     from .url_validator import join_url
 
-    soup = BeautifulSoup(html, 'lxml')
-    potential_urls = set()
+    if not html:
+        return
 
-    # Common paths to check
-    common_paths = [
-        '/team', '/about', '/therapists', '/clinicians',
-        '/meet-the-team', '/our-team', '/staff', '/meet-our-therapists',
-        '/about-us', '/our-therapists', '/our-clinicians', '/providers'
-    ]
+    try:
+        doc = lxml.html.document_fromstring(html.encode('utf-8'), parser=_LINK_PARSER)
+    except etree.ParserError:
+        return
 
-    for path in common_paths:
-        potential_urls.add(join_url(base_url, path))
+    # Parse the base once; most links are absolute or root-relative and only need concatenation
+    parsed_base = urlparse(base_url)
+    origin = f"{parsed_base.scheme}://{parsed_base.netloc}"
 
-    # Find links in navigation with relevant keywords
-    nav_keywords = ['team', 'about', 'therapist', 'clinician', 'staff', 'provider', 'meet', 'bio']
+    for element, attribute, link, _ in doc.iterlinks():
+        if attribute != 'href' or element.tag != 'a':
+            continue
 
-    all_links = soup.find_all('a', href=True)
+        if link.startswith(('http://', 'https://')):
+            yield element, link
+        elif link.startswith('/') and not _NEEDS_URLJOIN_RE.search(link):
+            yield element, origin + link
+        else:
+            yield element, join_url(base_url, link)
 
-    for link in all_links:
-        href = link['href']
-        link_text = link.get_text(strip=True).lower()
-        full_url = join_url(base_url, href)
-        url_lower = full_url.lower()
+
+def _stripped_text(element: HtmlElement) -> str:
+    """Concatenate an element's text fragments, each stripped of surrounding whitespace."""
+    return ''.join(fragment.strip() for fragment in element.itertext())
+
+
+def _common_team_urls(base_url: str) -> List[str]:
+    """Absolute URLs of the common team/about paths the legacy finder always checks."""
+    from .url_validator import join_url
+
+    return [join_url(base_url, path) for path in _COMMON_TEAM_PATHS]
+
+
+def _find_therapist_pages_legacy(html: str, base_url: str) -> List[str]:
+    """Legacy pattern-based therapist page finder (fallback only)."""
+    # Common paths to check
+    potential_urls = set(_common_team_urls(base_url))
+
+    # Find links in navigation with relevant keywords
+    base_netloc = url_netloc(base_url)
+
+    for link, full_url in _iter_page_links(html, base_url):
+        link_text = _stripped_text(link).lower()
 
         # Skip if external link
-        if not _is_same_domain(full_url, base_url):
+        if not _is_same_domain(full_url, base_netloc):
             continue
 
         # Check if link text contains relevant keywords
-        if any(keyword in link_text for keyword in nav_keywords):
+        if _THERAPIST_NAV_KEYWORDS_RE.search(link_text):
             potential_urls.add(full_url)
 
         # Check if URL path contains relevant keywords
         url_path = urlparse(full_url).path.lower()
-        if any(keyword in url_path for keyword in nav_keywords):
+        if _THERAPIST_NAV_KEYWORDS_RE.search(url_path):
             potential_urls.add(full_url)
 
     return list(potential_urls)
@@ -148,27 +265,19 @@ def _find_therapist_pages_legacy(html: str, base_url: str) -> List[str]:
 
 def _find_specialty_pages_legacy(html: str, base_url: str) -> List[Tuple[str, int]]:
     """Legacy pattern-based specialty page finder (fallback only)."""
-    from bs4 import BeautifulSoup
-    from .url_validator import join_url
-
-    soup = BeautifulSoup(html, 'lxml')
     url_scores = {}
+    base_netloc = url_netloc(base_url)
 
-    all_links = soup.find_all('a', href=True)
-
-    for link in all_links:
-        href = link['href']
-        full_url = join_url(base_url, href)
-
+    for link, full_url in _iter_page_links(html, base_url):
         if full_url in url_scores:
             continue
 
-        if not _is_same_domain(full_url, base_url):
+        if not _is_same_domain(full_url, base_netloc):
             continue
 
         score = _score_specialty_url(
             full_url,
-            link.get_text(strip=True),
+            _stripped_text(link),
             _get_parent_context(link)
         )
 
@@ -188,38 +297,27 @@ def _score_specialty_url(url: str, link_text: str, context: str) -> int:
     link_text_lower = link_text.lower()
     context_lower = context.lower()
 
-    if re.search(r'/[\w-]+-therapy/?$', url_lower):
+    if _THERAPY_URL_RE.search(url_lower):
         score += 3
-    if re.search(r'/[\w-]+-counseling/?$', url_lower):
+    if _COUNSELING_URL_RE.search(url_lower):
         score += 3
-    if re.search(r'/[\w-]+-treatment/?$', url_lower):
+    if _TREATMENT_URL_RE.search(url_lower):
         score += 2
 
-    service_keywords = ['service', 'specialty', 'specialize', 'treatment', 'help']
-    if any(keyword in url_lower for keyword in service_keywords):
+    if _SERVICE_KEYWORDS_RE.search(url_lower):
         score += 2
 
-    nav_keywords = ['service', 'specialty', 'specialties', 'offering', 'offerings', 'we help', 'conditions']
-    if any(keyword in context_lower for keyword in nav_keywords):
+    if _NAV_KEYWORDS_RE.search(context_lower):
         score += 2
 
-    specialty_indicators = [
-        'therapy', 'counseling', 'treatment', 'anxiety', 'depression',
-        'trauma', 'emdr', 'couples', 'family', 'individual', 'grief',
-        'addiction', 'ptsd', 'ocd'
-    ]
-    if any(indicator in link_text_lower for indicator in specialty_indicators):
+    if _SPECIALTY_INDICATORS_RE.search(link_text_lower):
         score += 2
 
-    excluded_keywords = [
-        'contact', 'about', 'team', 'blog', 'privacy', 'terms',
-        'faq', 'insurance', 'fees', 'location', 'directions', 'schedule'
-    ]
-    if any(keyword in url_lower for keyword in excluded_keywords):
+    if _EXCLUDED_KEYWORDS_RE.search(url_lower):
         score -= 5
 
     parsed = urlparse(url)
-    if parsed.path in ['', '/', '/index', '/index.html', '/home']:
+    if parsed.path in _HOMEPAGE_PATHS:
         score -= 5
 
     return score
@@ -228,33 +326,45 @@ def _score_specialty_url(url: str, link_text: str, context: str) -> int:
 def _get_parent_context(element) -> str:
     """Get text context from parent elements (nav, section, etc.)."""
     context = ""
-    parent = element.find_parent(['nav', 'section', 'div'])
-    if parent:
-        heading = parent.find(['h1', 'h2', 'h3', 'h4'])
-        if heading:
-            context = heading.get_text(strip=True)
+    parent = next(element.iterancestors('nav', 'section', 'div'), None)
+    if parent is not None:
+        heading = next(parent.iterdescendants('h1', 'h2', 'h3', 'h4'), None)
+        if heading is not None:
+            context = _stripped_text(heading)
     return context
 
 
-def _is_same_domain(url1: str, url2: str) -> bool:
-    """Check if two URLs are from the same domain."""
-    domain1 = urlparse(url1).netloc
-    domain2 = urlparse(url2).netloc
-    return domain1 == domain2
+def _is_same_domain(url: str, base_netloc: str) -> bool:
+    """Check if a URL is on the site's domain (base_netloc is parsed once by the caller)."""
+    return url_netloc(url) == base_netloc
+
+
+def _dedupe_key(url: str) -> str:
+    """Comparison key for a URL: lowercased, without fragment, trailing slash or tracking params."""
+    url = url.split('#', 1)[0]
+    if '?' not in url:
+        return url.rstrip('/').lower()
+
+    # Keep real query parameters (e.g. WordPress ?page_id=12) since they identify the page
+    path, query = url.split('?', 1)
+    kept = [param for param in query.split('&') if param and not _TRACKING_PARAM_RE.match(param)]
+    key = path.rstrip('/').lower()
+    return f"{key}?{'&'.join(kept).lower()}" if kept else key
 
 
 def deduplicate_urls(urls: List[str]) -> List[str]:
     """
     Remove duplicate URLs, keeping only one version.
 
-    Handles cases like /page vs /page/ or http vs https.
+    Handles cases like /page vs /page/, differing case, fragments, and tracking
+    parameters such as utm_source or fbclid.
     """
     seen = set()
     unique_urls = []
 
     for url in urls:
         # Normalize for comparison
-        normalized = url.lower().rstrip('/')
+        normalized = _dedupe_key(url)
 
         if normalized not in seen:
             seen.add(normalized)
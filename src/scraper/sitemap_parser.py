@@ -1,9 +1,85 @@
 """Parse sitemaps to discover all URLs on a therapy website."""
+import io
+import logging
 import requests
-import xml.etree.ElementTree as ET
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from typing import List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
+from .http_cache import HttpCache
+from .url_validator import url_netloc
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Shared session so sitemap probes and sub-sitemap fetches reuse pooled TCP/TLS connections
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
+
+# Maximum concurrent sitemap fetches
+MAX_FETCH_WORKERS = 8
+
+# Sitemap and robots.txt bodies are cached on disk. Within the TTL they're reused without a
+# request; after it they're revalidated with ETag/Last-Modified so unchanged files come back
+# as a bodiless 304.
+SITEMAP_CACHE_DIR = Path.home() / ".cache" / "therapist-bio" / "http"
+SITEMAP_CACHE_TTL = 60 * 60  # seconds
+_HTTP_CACHE = HttpCache(SITEMAP_CACHE_DIR, SITEMAP_CACHE_TTL)
+
+
+def _fetch(url: str, timeout: int) -> Optional[bytes]:
+    """
+    GET a sitemap-related URL with the shared session, using the on-disk cache.
+
+    Args:
+        url: URL to fetch
+        timeout: Request timeout in seconds
+
+    Returns:
+        Response body for a 200 (or a 304 served from cache), or None otherwise
+    """
+    cached = _HTTP_CACHE.get(url)
+    if cached is not None and _HTTP_CACHE.is_fresh(cached):
+        return cached['body']
+
+    try:
+        response = _SESSION.get(url, timeout=timeout, headers=HttpCache.validator_headers(cached))
+    except requests.RequestException as e:
+        logger.warning("Could not fetch %s: %s", url, e)
+        return None
+
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+
+    if response.status_code == 304 and cached is not None:
+        # Unchanged: reuse the cached body (a 304 may omit validators it didn't change)
+        body = cached['body']
+        etag = etag or cached.get('etag')
+        last_modified = last_modified or cached.get('last_modified')
+    elif response.status_code == 200:
+        body = response.content
+    else:
+        return None
+
+    try:
+        _HTTP_CACHE.set(url, body, etag, last_modified)
+    except OSError as e:
+        logger.warning("Could not write sitemap cache: %s", e)
+    return body
+
+
+def _fetch_all(urls: List[str], timeout: int) -> List[Optional[bytes]]:
+    """Fetch several URLs concurrently, returning bodies in the same order as urls."""
+    if not urls:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(urls))) as executor:
+        return list(executor.map(lambda url: _fetch(url, timeout), urls))
 
 
 def fetch_sitemap_urls(base_url: str, timeout: int = 10) -> List[str]:
@@ -27,105 +103,125 @@ def fetch_sitemap_urls(base_url: str, timeout: int = 10) -> List[str]:
         f"{base_url}/sitemap1.xml"
     ]
 
-    for sitemap_url in sitemap_urls:
-        try:
-            print(f"Trying sitemap: {sitemap_url}")
-            response = requests.get(sitemap_url, timeout=timeout)
+    # Probe every candidate at once; the earliest candidate in the list that works wins.
+    # robots.txt goes in the same batch so the fallback below doesn't cost another round trip.
+    logger.debug("Trying sitemaps: %s", sitemap_urls)
+    *bodies, robots_body = _fetch_all(sitemap_urls + [f"{base_url}/robots.txt"], timeout)
 
-            if response.status_code == 200:
-                print(f"[OK] Found sitemap at: {sitemap_url}")
-                urls = _parse_sitemap_xml(response.text, base_url)
+    for sitemap_url, body in zip(sitemap_urls, bodies):
+        if body is not None:
+            logger.info("Found sitemap at: %s", sitemap_url)
+            urls = _collect_sitemap_urls(body, base_url, timeout)
 
-                if urls:
-                    print(f"[OK] Extracted {len(urls)} URLs from sitemap")
-                    return urls
-
-        except requests.RequestException as e:
-            print(f"  Could not fetch {sitemap_url}: {e}")
-            continue
+            if urls:
+                logger.info("Extracted %d URLs from sitemap", len(urls))
+                return urls
 
     # If no sitemap found, try robots.txt
-    print("No sitemap.xml found, checking robots.txt...")
-    sitemap_from_robots = _get_sitemap_from_robots(base_url, timeout)
+    logger.info("No sitemap.xml found, checking robots.txt")
+    sitemap_from_robots = _get_sitemap_from_robots(robots_body)
 
     if sitemap_from_robots:
-        try:
-            response = requests.get(sitemap_from_robots, timeout=timeout)
-            if response.status_code == 200:
-                print(f"[OK] Found sitemap from robots.txt: {sitemap_from_robots}")
-                urls = _parse_sitemap_xml(response.text, base_url)
-                if urls:
-                    print(f"[OK] Extracted {len(urls)} URLs from sitemap")
-                    return urls
-        except requests.RequestException:
-            pass
-
-    print("No sitemap found, will fall back to crawling")
+        body = _fetch(sitemap_from_robots, timeout)
+        if body is not None:
+            logger.info("Found sitemap from robots.txt: %s", sitemap_from_robots)
+            urls = _collect_sitemap_urls(body, base_url, timeout)
+            if urls:
+                logger.info("Extracted %d URLs from sitemap", len(urls))
+                return urls
+
+    logger.info("No sitemap found, will fall back to crawling")
     return []
 
 
-def _parse_sitemap_xml(xml_content: str, base_url: str) -> List[str]:
+def _collect_sitemap_urls(sitemap_body: bytes, base_url: str, timeout: int = 10) -> List[str]:
     """
-    Parse sitemap XML and extract all URLs.
+    Collect page URLs from a sitemap, following sitemap indexes to any depth.
+
+    Sub-sitemaps are expanded with a worklist rather than recursion: each round fetches
+    every pending sub-sitemap concurrently, then queues the children those reference.
+
+    Args:
+        sitemap_body: Body of the top-level sitemap or sitemap index
+        base_url: The base URL of the website
+        timeout: Request timeout in seconds
 
-    Handles both regular sitemaps and sitemap indexes.
+    Returns:
+        Deduplicated page URLs on the site's domain, in sitemap order
     """
-    urls = []
+    sub_sitemap_urls, urls = _parse_sitemap_xml(sitemap_body, base_url)
+    seen_sitemaps = set()
 
-    try:
-        root = ET.fromstring(xml_content)
-
-        # Remove namespace for easier parsing
-        # Sitemaps use namespace like {http://www.sitemaps.org/schemas/sitemap/0.9}
-        for elem in root.iter():
-            if '}' in elem.tag:
-                elem.tag = elem.tag.split('}')[1]
-
-        # Check if this is a sitemap index (contains other sitemaps)
-        sitemap_locs = root.findall('.//sitemap/loc')
-
-        if sitemap_locs:
-            # This is a sitemap index, fetch each sub-sitemap
-            print(f"Found sitemap index with {len(sitemap_locs)} sub-sitemaps")
-            for loc in sitemap_locs:
-                if loc.text:
-                    try:
-                        response = requests.get(loc.text, timeout=10)
-                        if response.status_code == 200:
-                            sub_urls = _parse_sitemap_xml(response.text, base_url)
-                            urls.extend(sub_urls)
-                    except requests.RequestException:
-                        continue
-        else:
-            # Regular sitemap, extract URLs
-            url_locs = root.findall('.//url/loc')
-
-            for loc in url_locs:
-                if loc.text:
-                    url = loc.text.strip()
-                    # Only include URLs from the same domain
-                    if urlparse(url).netloc == urlparse(base_url).netloc:
-                        urls.append(url)
-
-    except ET.ParseError as e:
-        print(f"Error parsing sitemap XML: {e}")
+    pending = list(dict.fromkeys(sub_sitemap_urls))
+    while pending:
+        # Guard against indexes that reference each other (or themselves)
+        seen_sitemaps.update(pending)
+        logger.info("Found sitemap index with %d sub-sitemaps", len(pending))
 
-    return urls
+        next_pending = []
+        for body in _fetch_all(pending, timeout):
+            if body is not None:
+                children, page_urls = _parse_sitemap_xml(body, base_url)
+                urls.extend(page_urls)
+                next_pending.extend(child for child in children if child not in seen_sitemaps)
 
+        pending = list(dict.fromkeys(next_pending))
 
-def _get_sitemap_from_robots(base_url: str, timeout: int = 10) -> Optional[str]:
-    """Check robots.txt for sitemap URL."""
-    try:
-        robots_url = f"{base_url}/robots.txt"
-        response = requests.get(robots_url, timeout=timeout)
+    # Sub-sitemaps (and sloppy generators) repeat URLs; keep the first occurrence of each
+    return list(dict.fromkeys(urls))
 
-        if response.status_code == 200:
-            for line in response.text.split('\n'):
-                if line.lower().startswith('sitemap:'):
-                    sitemap_url = line.split(':', 1)[1].strip()
-                    return sitemap_url
-    except requests.RequestException:
-        pass
+
+def _parse_sitemap_xml(xml_content: bytes, base_url: str) -> Tuple[List[str], List[str]]:
+    """
+    Parse one sitemap document without fetching anything.
+
+    Handles both regular sitemaps and sitemap indexes. Entries are streamed with
+    iterparse and discarded once read, so large sitemaps are never held as a full tree.
+
+    Returns:
+        Tuple of (sub_sitemap_urls, page_urls); page URLs are limited to the site's domain
+    """
+    urls = []
+    sub_sitemap_urls = []
+    base_netloc = urlparse(base_url).netloc
+
+    try:
+        # {*} matches the sitemap namespace (or none), so no namespace stripping pass is needed
+        entries = etree.iterparse(
+            io.BytesIO(xml_content),
+            events=('end',),
+            tag=('{*}url', '{*}sitemap'),
+            resolve_entities=False
+        )
+
+        for _, entry in entries:
+            loc = entry.findtext('{*}loc')
+            if loc:
+                loc = loc.strip()
+                if etree.QName(entry).localname == 'sitemap':
+                    sub_sitemap_urls.append(loc)
+                # Only include URLs from the same domain
+                elif urlparse(loc).netloc == base_netloc:
+                    urls.append(loc)
+
+            # Free the finished entry and any siblings already processed
+            entry.clear(keep_tail=True)
+            while entry.getprevious() is not None:
+                del entry.getparent()[0]
+
+    except etree.XMLSyntaxError as e:
+        logger.warning("Error parsing sitemap XML: %s", e)
+
+    return sub_sitemap_urls, urls
+
+
+def _get_sitemap_from_robots(robots_body: Optional[bytes]) -> Optional[str]:
+    """Read the sitemap URL from a fetched robots.txt body."""
+    if robots_body is not None:
+        for line in robots_body.decode('utf-8', errors='replace').split('\n'):
+            if line.lower().startswith('sitemap:'):
+                sitemap_url = line.split(':', 1)[1].strip()
+                return sitemap_url
 
     return None
 
@@ -137,32 +233,39 @@ def crawl_homepage_links(base_url: str, timeout: int = 10) -> List[str]:
     Use this when no sitemap is available.
     """
     urls = []
+    seen = set()
+    base_netloc = urlparse(base_url).netloc
 
     try:
-        print(f"Crawling homepage for links: {base_url}")
-        response = requests.get(base_url, timeout=timeout)
+        logger.info("Crawling homepage for links: %s", base_url)
+        response = _SESSION.get(base_url, timeout=timeout)
 
         if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'lxml')
+            # Parse the raw bytes with lxml and walk its native link iterator
+            doc = lxml.html.fromstring(response.content)
 
             # Find all internal links
-            for link in soup.find_all('a', href=True):
-                href = link['href']
+            for element, attribute, href, _ in doc.iterlinks():
+                if attribute != 'href' or element.tag != 'a':
+                    continue
 
                 # Convert relative URLs to absolute
                 full_url = urljoin(base_url, href)
 
                 # Only include URLs from same domain
-                if urlparse(full_url).netloc == urlparse(base_url).netloc:
+                if url_netloc(full_url) == base_netloc:
                     # Remove fragments and query params for cleaner URLs
-                    clean_url = full_url.split('#')[0].split('?')[0]
+                    clean_url = full_url.split('#', 1)[0].split('?', 1)[0]
 
-                    if clean_url and clean_url not in urls:
+                    if clean_url and clean_url not in seen:
+                        seen.add(clean_url)
                         urls.append(clean_url)
 
-            print(f"[OK] Found {len(urls)} links on homepage")
+            logger.info("Found %d links on homepage", len(urls))
 
     except requests.RequestException as e:
-        print(f"Error crawling homepage: {e}")
+        logger.warning("Error crawling homepage: %s", e)
+    except etree.ParserError as e:
+        logger.warning("Error parsing homepage: %s", e)
 
     return urls
@@ -1,52 +1,22 @@
 """AI-powered URL classification using Claude API."""
+import hashlib
 import json
-from typing import List, Dict
+import logging
+import os
+import re
+import tempfile
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Dict, Optional
 from anthropic import Anthropic
 
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
-def classify_urls_with_ai(
-    urls: List[str],
-    api_key: str,
-    base_url: str
-) -> Dict[str, List[str]]:
-    """
-    Use Claude AI to classify URLs into therapist pages vs specialty pages.
-
-    Args:
-        urls: List of URLs to classify
-        api_key: Anthropic API key
-        base_url: The base URL of the website (for context)
-
-    Returns:
-        Dictionary with keys: 'therapist_pages', 'specialty_pages', 'other'
-    """
-    if not urls:
-        return {'therapist_pages': [], 'specialty_pages': [], 'other': []}
-
-    # Limit to reasonable number of URLs to avoid token limits
-    if len(urls) > 100:
-        print(f"[WARNING] Too many URLs ({len(urls)}), sampling 100 most relevant")
-        urls = _filter_relevant_urls(urls, base_url)[:100]
-
-    print(f"[AI] Using AI to classify {len(urls)} URLs...")
-
-    # DEBUG: Show sample URLs being classified
-    import sys
-    print(f"DEBUG: Sample URLs being sent to AI:", file=sys.stderr, flush=True)
-    for url in urls[:10]:
-        print(f"  - {url}", file=sys.stderr, flush=True)
-
-    client = Anthropic(api_key=api_key)
-
-    # Build the prompt
-    url_list = "\n".join([f"{i+1}. {url}" for i, url in enumerate(urls)])
-
-    prompt = f"""You are analyzing URLs from a therapy/counseling website to identify which pages contain therapist bios vs which contain specialty/service descriptions.
-
-Website: {base_url}
-
-URLs to classify:
-{url_list}
+# Static instructions sent ahead of every URL list. They are far shorter than the
+# minimum prompt-cache prefix for these models, so they aren't marked for caching.
+CLASSIFICATION_INSTRUCTIONS = """You are analyzing URLs from a therapy/counseling website to identify which pages contain therapist bios vs which contain specialty/service descriptions.
 
 Classify each URL into one of these categories:
 
@@ -64,67 +34,248 @@ Classify each URL into one of these categories:
    - Examples: /, /contact, /blog, /resources, /insurance, /faq
 
 Return ONLY a valid JSON object in this exact format (no markdown, no explanation):
-{{
+{
   "therapist_pages": ["url1", "url2"],
   "specialty_pages": ["url3", "url4"],
   "other": ["url5"]
-}}
+}
 
 Important:
-- Include the FULL URL in your response, exactly as provided above
+- Include the FULL URL in your response, exactly as provided below
 - Be generous with therapist pages - when in doubt, include it
 - Group practice sites may have multiple therapist pages
 - Return ONLY the JSON object, nothing else"""
 
-    try:
-        response = client.messages.create(
-            model="claude-sonnet-4-5-20250929",
-            max_tokens=4000,
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
-        )
+# Classification is pattern matching over short URL strings, so the fast model handles it;
+# the larger model is only used when the fast model's answer can't be trusted
+CLASSIFIER_MODEL = "claude-haiku-4-5"
+FALLBACK_MODEL = "claude-sonnet-4-5-20250929"
+ESCALATION_MIN_URLS = 50
+
+# Only the most relevant URLs are sent, which keeps the prompt (and its latency and cost) small
+MAX_CLASSIFY_URLS = 40
+_STATIC_ASSET_RE = re.compile(r'\.(css|js|png|jpg|jpeg|gif|svg|webp|pdf|ico|woff2?)(\?|$)', re.IGNORECASE)
+
+# Relevance hints used to rank URLs, each keyword list compiled into a single alternation
+_THERAPIST_PATH_RE = re.compile('about|team|staff|therapist|clinician|dr-|meet')
+_SPECIALTY_PATH_RE = re.compile(
+    'therapy|counseling|treatment|service|anxiety|depression|trauma|couples|family|emdr|cbt'
+)
+_NON_CONTENT_PATH_RE = re.compile(
+    'blog|post|article|resource|tag|category|archive|wp-content|feed|sitemap'
+)
 
-        response_text = response.content[0].text.strip()
+# Classifications are cached by URL set so re-running against the same site skips the API call
+CLASSIFICATION_CACHE_DIR = Path.home() / ".cache" / "therapist-bio" / "url_cls"
+CLASSIFICATION_CACHE_TTL = 7 * 24 * 60 * 60  # seconds
+_memory_cache: Dict[str, Dict[str, List[str]]] = {}
 
-        # Remove markdown code blocks if present
-        if response_text.startswith('```'):
-            lines = response_text.split('\n')
-            response_text = '\n'.join(lines[1:-1])
 
-        result = json.loads(response_text)
+def classify_urls_with_ai(
+    urls: List[str],
+    api_key: str,
+    base_url: str
+) -> Dict[str, List[str]]:
+    """
+    Use Claude AI to classify URLs into therapist pages vs specialty pages.
+
+    Args:
+        urls: List of URLs to classify
+        api_key: Anthropic API key
+        base_url: The base URL of the website (for context)
+
+    Returns:
+        Dictionary with keys: 'therapist_pages', 'specialty_pages', 'other'
+    """
+    if not urls:
+        return {'therapist_pages': [], 'specialty_pages': [], 'other': []}
 
-        print(f"[OK] AI classified URLs:")
-        print(f"  - {len(result.get('therapist_pages', []))} therapist pages")
-        print(f"  - {len(result.get('specialty_pages', []))} specialty pages")
-        print(f"  - {len(result.get('other', []))} other pages")
+    cache_key = _classification_cache_key(urls, base_url)
+    cached = _load_cached_classification(cache_key)
+    if cached is not None:
+        logger.info("Using cached classification for %d URLs", len(urls))
+        return cached
+
+    total_urls = len(urls)
+
+    # Static assets are never therapist or specialty pages
+    urls = [url for url in urls if not _STATIC_ASSET_RE.search(url)]
+    if not urls:
+        return {'therapist_pages': [], 'specialty_pages': [], 'other': []}
+
+    # Send only the most relevant URLs to keep the prompt small
+    if len(urls) > MAX_CLASSIFY_URLS:
+        logger.info("%d candidate URLs, sending the %d most relevant", len(urls), MAX_CLASSIFY_URLS)
+    urls = _filter_relevant_urls(urls, base_url)[:MAX_CLASSIFY_URLS]
+
+    logger.info("Using AI to classify %d URLs", len(urls))
+    logger.debug("Sample URLs being sent to AI: %s", urls[:10])
+
+    client = _get_client(api_key)
+
+    # Build the prompt
+    url_list = "\n".join([f"{i+1}. {url}" for i, url in enumerate(urls)])
+
+    request_text = f"Website: {base_url}\n\nURLs to classify:\n{url_list}"
+
+    try:
+        response_text = _request_classification(client, CLASSIFIER_MODEL, request_text)
+        try:
+            result = json.loads(response_text)
+        except json.JSONDecodeError:
+            result = None
+
+        # Escalate to the larger model if the fast one returned unusable output, or
+        # found no therapist pages on a site large enough that it almost certainly has some
+        cacheable = True
+        if result is None:
+            logger.info("%s classification unusable, retrying with %s", CLASSIFIER_MODEL, FALLBACK_MODEL)
+            response_text = _request_classification(client, FALLBACK_MODEL, request_text)
+            result = json.loads(response_text)
+        elif not result.get('therapist_pages') and total_urls > ESCALATION_MIN_URLS:
+            logger.info("%s found no therapist pages, retrying with %s", CLASSIFIER_MODEL, FALLBACK_MODEL)
+            try:
+                result = json.loads(_request_classification(client, FALLBACK_MODEL, request_text))
+            except Exception as e:
+                # Keep the fast model's otherwise valid result (e.g. its specialty pages),
+                # but don't cache it so a later run can try the larger model again
+                logger.warning("%s escalation failed, keeping %s result: %s", FALLBACK_MODEL, CLASSIFIER_MODEL, e)
+                cacheable = False
 
-        # DEBUG: Print actual therapist pages found
-        import sys
         therapist_pages = result.get('therapist_pages', [])
+        logger.info(
+            "AI classified URLs: %d therapist pages, %d specialty pages, %d other pages",
+            len(therapist_pages),
+            len(result.get('specialty_pages', [])),
+            len(result.get('other', []))
+        )
         if therapist_pages:
-            print(f"DEBUG: Therapist pages found:", file=sys.stderr, flush=True)
-            for url in therapist_pages[:10]:  # Show first 10
-                print(f"  - {url}", file=sys.stderr, flush=True)
+            logger.debug("Therapist pages found: %s", therapist_pages[:10])
         else:
-            print(f"DEBUG: NO therapist pages found. Sample 'other' URLs:", file=sys.stderr, flush=True)
-            for url in result.get('other', [])[:10]:
-                print(f"  - {url}", file=sys.stderr, flush=True)
+            logger.debug("No therapist pages found. Sample 'other' URLs: %s", result.get('other', [])[:10])
 
+        if cacheable:
+            _store_classification(cache_key, result)
         return result
 
     except json.JSONDecodeError as e:
-        print(f"[ERROR] Error parsing AI response: {e}")
-        print(f"Response was: {response_text}")
+        logger.error("Error parsing AI response: %s", e)
+        logger.debug("Response was: %s", response_text)
         # Fallback to empty classification
         return {'therapist_pages': [], 'specialty_pages': [], 'other': urls}
 
     except Exception as e:
-        print(f"[ERROR] Error calling Claude API: {e}")
+        logger.error("Error calling Claude API: %s", e)
         # Fallback to empty classification
         return {'therapist_pages': [], 'specialty_pages': [], 'other': urls}
 
 
+@lru_cache(maxsize=4)
+def _get_client(api_key: str) -> Anthropic:
+    """Return a shared client per API key so repeat calls reuse its pooled connection."""
+    return Anthropic(api_key=api_key)
+
+
+def _request_classification(client: Anthropic, model: str, request_text: str) -> str:
+    """
+    Send one classification request and return the raw JSON text.
+
+    Args:
+        client: Anthropic client
+        model: Claude model to use
+        request_text: Per-site suffix with the website and numbered URL list
+
+    Returns:
+        Response text with any markdown code fence removed
+    """
+    # Stream the reply so the text is read off the wire while it's still being generated
+    with client.messages.stream(
+        model=model,
+        max_tokens=4000,
+        messages=[{
+            "role": "user",
+            "content": [
+                {"type": "text", "text": CLASSIFICATION_INSTRUCTIONS},
+                {"type": "text", "text": request_text},
+            ],
+        }]
+    ) as stream:
+        response_text = "".join(stream.text_stream).strip()
+
+    # Remove markdown code blocks if present
+    if response_text.startswith('```'):
+        lines = response_text.split('\n')
+        response_text = '\n'.join(lines[1:-1])
+
+    return response_text
+
+
+def _classification_cache_key(urls: List[str], base_url: str) -> str:
+    """
+    Hash a site's URL set into a cache key.
+
+    Args:
+        urls: URLs to classify (order doesn't matter)
+        base_url: The base URL of the website
+
+    Returns:
+        Hex digest identifying this classification request
+    """
+    payload = "\n".join(sorted(urls)) + "|" + base_url
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _load_cached_classification(cache_key: str) -> Optional[Dict[str, List[str]]]:
+    """
+    Look up a classification in memory, then on disk.
+
+    Args:
+        cache_key: Key from _classification_cache_key
+
+    Returns:
+        Cached classification, or None on a miss or expired entry
+    """
+    if cache_key in _memory_cache:
+        return _memory_cache[cache_key]
+
+    try:
+        with open(CLASSIFICATION_CACHE_DIR / f"{cache_key}.json", encoding="utf-8") as f:
+            entry = json.load(f)
+        if time.time() - entry["created"] > CLASSIFICATION_CACHE_TTL:
+            return None
+        result = entry["result"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    _memory_cache[cache_key] = result
+    return result
+
+
+def _store_classification(cache_key: str, result: Dict[str, List[str]]):
+    """
+    Save a classification in memory and on disk.
+
+    Args:
+        cache_key: Key from _classification_cache_key
+        result: Parsed classification returned by the API
+    """
+    _memory_cache[cache_key] = result
+
+    tmp_path = None
+    try:
+        CLASSIFICATION_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and rename so a concurrent reader never sees a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=CLASSIFICATION_CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"created": time.time(), "result": result}, f)
+        os.replace(tmp_path, CLASSIFICATION_CACHE_DIR / f"{cache_key}.json")
+    except OSError as e:
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        # A read-only home directory shouldn't stop the run; the in-memory entry still applies
+        logger.warning("Could not write classification cache: %s", e)
+
+
 def _filter_relevant_urls(urls: List[str], base_url: str) -> List[str]:
     """
     Filter URLs to keep most relevant ones.
@@ -141,17 +292,15 @@ def _filter_relevant_urls(urls: List[str], base_url: str) -> List[str]:
         path = url.replace(base_url, '').lower()
 
         # Boost for potential therapist pages
-        if any(word in path for word in ['about', 'team', 'staff', 'therapist', 'clinician', 'dr-', 'meet']):
+        if _THERAPIST_PATH_RE.search(path):
             score += 10
 
         # Boost for potential specialty pages
-        if any(word in path for word in ['therapy', 'counseling', 'treatment', 'service', 'anxiety',
-                                          'depression', 'trauma', 'couples', 'family', 'emdr', 'cbt']):
+        if _SPECIALTY_PATH_RE.search(path):
             score += 5
 
         # Penalize likely non-content pages
-        if any(word in path for word in ['blog', 'post', 'article', 'resource', 'tag', 'category',
-                                          'archive', 'wp-content', 'feed', 'sitemap']):
+        if _NON_CONTENT_PATH_RE.search(path):
             score -= 20
 
         # Prefer shorter paths
@@ -1,7 +1,24 @@
 """URL validation and normalization utilities."""
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlparse, urljoin
-from typing import Optional
+from urllib3.util.retry import Retry
+from typing import Dict, List, Optional
+
+# Shared session so repeated validations reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=1, backoff_factor=0.2)
+)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
+
+# HEAD responses that usually mean "method not allowed here" rather than "page missing"
+HEAD_REJECTED_STATUS_CODES = {403, 405, 501}
 
 
 def normalize_url(url: str) -> str:
@@ -48,10 +65,23 @@ def validate_url(url: str, timeout: int = 10) -> tuple[bool, Optional[str]]:
             return False, "Invalid URL format"
 
         # Make HEAD request to check accessibility
-        response = requests.head(url, timeout=timeout, allow_redirects=True)
-
-        if response.status_code >= 400:
-            return False, f"Site returned status code {response.status_code}"
+        response = _SESSION.head(url, timeout=timeout, allow_redirects=True)
+        status_code = response.status_code
+
+        # Some servers reject HEAD outright; confirm with a GET for a single byte,
+        # streamed and closed without ever reading the body
+        if status_code in HEAD_REJECTED_STATUS_CODES:
+            with _SESSION.get(
+                url,
+                timeout=timeout,
+                stream=True,
+                allow_redirects=True,
+                headers={'Range': 'bytes=0-0'}
+            ) as response:
+                status_code = response.status_code
+
+        if status_code >= 400:
+            return False, f"Site returned status code {status_code}"
 
         return True, None
 
@@ -65,6 +95,46 @@ def validate_url(url: str, timeout: int = 10) -> tuple[bool, Optional[str]]:
         return False, f"Validation error: {str(e)}"
 
 
+def validate_urls(
+    urls: List[str],
+    timeout: int = 10,
+    max_workers: int = 16
+) -> Dict[str, tuple[bool, Optional[str]]]:
+    """
+    Validate several URLs concurrently.
+
+    Args:
+        urls: The URLs to validate
+        timeout: Request timeout in seconds
+        max_workers: Maximum number of concurrent HEAD requests
+
+    Returns:
+        Dictionary mapping each URL to its (is_valid, error_message) tuple
+    """
+    if not urls:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        results = executor.map(lambda url: validate_url(url, timeout), urls)
+        return dict(zip(urls, results))
+
+
+@lru_cache(maxsize=4096)
+def url_netloc(url: str) -> str:
+    """
+    Return a URL's network location, caching the parse.
+
+    Pages repeat the same links in navigation and footers, so most lookups are cache hits.
+
+    Args:
+        url: The URL to parse
+
+    Returns:
+        The URL's netloc (host and optional port)
+    """
+    return urlparse(url).netloc
+
+
 def join_url(base_url: str, path: str) -> str:
     """
     Join a base URL with a path, handling relative and absolute paths.
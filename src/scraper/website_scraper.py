@@ -1,15 +1,107 @@
 """Main website scraper orchestrator."""
+import codecs
+import hashlib
+import os
 import time
-import requests
+import threading
+import httpx
 import logging
-from typing import Optional, Callable
+from email.utils import parsedate_to_datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Callable, Tuple
 from ..models.data_models import ScrapingResult, Therapist, Specialty
-from .url_validator import normalize_url, validate_url
+from .http_cache import HttpCache
+from .url_validator import normalize_url, validate_url, url_netloc
 from .page_finder import find_pages_intelligently, deduplicate_urls
 from .content_extractor import extract_therapists, extract_specialty
 
 logger = logging.getLogger(__name__)
 
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+)
+
+DEFAULT_PAGE_CACHE_DIR = ".scraper_cache"
+
+# Pages larger than this are truncated; real therapist/specialty pages are far smaller
+MAX_PAGE_BYTES = 2_000_000
+
+# Responses retried after a backoff before giving up on a page
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 3
+
+# Pause a host once it reports this few requests left in its rate-limit window
+RATE_LIMIT_MIN_REMAINING = 1
+
+# Upper bound on any single server-requested pause, in seconds
+MAX_RATE_LIMIT_WAIT = 30.0
+
+
+def _valid_encoding(name: Optional[str]) -> str:
+    """
+    Resolve a charset name to a codec Python knows, falling back to UTF-8.
+
+    Args:
+        name: Charset from a response header or cache entry, or None
+
+    Returns:
+        Canonical codec name
+    """
+    try:
+        return codecs.lookup(name or 'utf-8').name
+    except LookupError:
+        return 'utf-8'
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header given as delay seconds or an HTTP date.
+
+    Args:
+        value: Header value, or None
+
+    Returns:
+        Seconds to wait, or None if the header is missing or malformed
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_rate_limit_reset(value: Optional[str]) -> Optional[float]:
+    """
+    Parse an X-RateLimit-Reset header given as delay seconds or a Unix timestamp.
+
+    Args:
+        value: Header value, or None
+
+    Returns:
+        Seconds until the rate-limit window resets, or None if missing or malformed
+    """
+    try:
+        reset = float(value)
+    except (TypeError, ValueError):
+        return None
+    # Large values are epoch timestamps rather than a number of seconds
+    if reset > 1_000_000_000:
+        reset -= time.time()
+    return max(0.0, reset)
+
 
 class WebsiteScraper:
     """Orchestrates scraping of therapy websites."""
@@ -19,21 +111,66 @@ class WebsiteScraper:
         rate_limit_delay: float = 1.0,
         timeout: int = 30000,
         progress_callback: Optional[Callable[[str], None]] = None,
-        api_key: Optional[str] = None
+        api_key: Optional[str] = None,
+        extraction_workers: Optional[int] = None,
+        fetch_workers: int = 8,
+        enable_cache: bool = True,
+        cache_dir: str = DEFAULT_PAGE_CACHE_DIR,
+        cache_ttl: float = 24 * 60 * 60
     ):
         """
         Initialize the scraper.
 
         Args:
-            rate_limit_delay: Delay between requests in seconds
+            rate_limit_delay: Base backoff in seconds when a host signals rate-limit pressure
+                without saying how long to wait; doubles on each retry
             timeout: Page load timeout in milliseconds
             progress_callback: Optional callback for progress updates
             api_key: Optional Anthropic API key for intelligent URL discovery
+            extraction_workers: Processes used to parse pages (defaults to the CPU count)
+            fetch_workers: Maximum pages fetched concurrently
+            enable_cache: Keep fetched pages on disk and revalidate them with ETag/Last-Modified
+                on later runs instead of downloading them again
+            cache_dir: Directory for the on-disk page cache
+            cache_ttl: Seconds a cached page is reused without contacting the site
         """
         self.rate_limit_delay = rate_limit_delay
         self.timeout = timeout
         self.progress_callback = progress_callback
         self.api_key = api_key
+        self.extraction_workers = extraction_workers or os.cpu_count() or 1
+        self.fetch_workers = max(1, fetch_workers)
+
+        # One client for every page. Over HTTP/2 (when h2 is installed and the site supports
+        # it) concurrent fetches share a single multiplexed connection; otherwise they fall
+        # back to pooled HTTP/1.1 keep-alive connections. Connection failures are retried
+        self.client = httpx.Client(
+            headers={'User-Agent': USER_AGENT},
+            timeout=self.timeout / 1000,  # Convert ms to seconds
+            follow_redirects=True,
+            transport=httpx.HTTPTransport(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+                retries=MAX_RETRIES
+            )
+        )
+
+        self.cache = HttpCache(cache_dir, cache_ttl) if enable_cache else None
+
+        # Requests are only paced when a host asks for it (429/503, Retry-After or a
+        # depleted X-RateLimit-Remaining); this maps host -> time it may be contacted again
+        self._host_resume_at: Dict[str, float] = {}
+        self._host_lock = threading.Lock()
+
+    def close(self):
+        """Close the HTTP client and its pooled connections."""
+        self.client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def _log(self, message: str):
         """Log a progress message."""
@@ -46,7 +183,8 @@ class WebsiteScraper:
         self,
         url: str,
         manual_about_urls: list = None,
-        manual_specialty_urls: list = None
+        manual_specialty_urls: list = None,
+        force_refresh: bool = False
     ) -> ScrapingResult:
         """
         Scrape a therapy website for therapists and specialties.
@@ -55,6 +193,7 @@ class WebsiteScraper:
             url: The website URL to scrape
             manual_about_urls: Optional list of manual therapist/about page URLs
             manual_specialty_urls: Optional list of manual specialty page URLs
+            force_refresh: Ignore cached pages and download everything again
 
         Returns:
             ScrapingResult with therapists, specialties, and any errors
@@ -79,35 +218,30 @@ class WebsiteScraper:
             )
 
         try:
-            # Debug: Check if API key is available
-            import sys
-            print(f"DEBUG: API key present: {bool(self.api_key)}", file=sys.stderr, flush=True)
-            print(f"DEBUG: API key value (first 10 chars): {self.api_key[:10] if self.api_key else 'None'}", file=sys.stderr, flush=True)
+            logger.debug("API key present: %s", bool(self.api_key))
 
             # Use intelligent discovery if API key is available
+            prefetched = {}
             if self.api_key:
-                print("DEBUG: Entering intelligent discovery branch", file=sys.stderr, flush=True)
+                logger.debug("Entering intelligent discovery branch")
                 self._log("Using intelligent AI-powered page discovery...")
                 therapist_urls, specialty_urls = find_pages_intelligently(url, self.api_key)
-                print(f"DEBUG: Intelligent discovery returned: {len(therapist_urls)} therapist URLs, {len(specialty_urls)} specialty URLs", file=sys.stderr, flush=True)
-
-                # Add manual URLs if provided
-                if manual_about_urls:
-                    self._log(f"Adding {len(manual_about_urls)} manual therapist URL(s)")
-                    therapist_urls.extend([normalize_url(u) for u in manual_about_urls])
-                    therapist_urls = deduplicate_urls(therapist_urls)
-
-                if manual_specialty_urls:
-                    self._log(f"Adding {len(manual_specialty_urls)} manual specialty URL(s)")
-                    specialty_urls.extend([normalize_url(u) for u in manual_specialty_urls])
-                    specialty_urls = deduplicate_urls(specialty_urls)
+                logger.debug(
+                    "Intelligent discovery returned: %d therapist URLs, %d specialty URLs",
+                    len(therapist_urls), len(specialty_urls)
+                )
 
             else:
                 # Fallback to old pattern-based approach
+                from .page_finder import (
+                    _common_team_urls, _find_therapist_pages_legacy, _find_specialty_pages_legacy
+                )
                 self._log("API key not provided, using pattern-based discovery...")
-                # Load homepage
+                # Load homepage, prefetching the common team pages alongside it since the
+                # legacy finder always returns them and they'd otherwise be fetched afterwards
                 self._log("Loading homepage...")
-                homepage_html = self._load_page(url)
+                prefetched = dict(self._load_pages([url] + _common_team_urls(url), force_refresh))
+                homepage_html = prefetched[url]
 
                 if not homepage_html:
                     errors.append("Failed to load homepage")
@@ -119,61 +253,67 @@ class WebsiteScraper:
                     )
 
                 # Find therapist pages (legacy)
-                from .page_finder import _find_therapist_pages_legacy, _find_specialty_pages_legacy
                 self._log("Finding therapist pages...")
                 therapist_urls = _find_therapist_pages_legacy(homepage_html, url)
-                therapist_urls = deduplicate_urls(therapist_urls)
-
-                # Add manual therapist URLs
-                if manual_about_urls:
-                    self._log(f"Adding {len(manual_about_urls)} manual therapist URL(s)")
-                    therapist_urls.extend([normalize_url(u) for u in manual_about_urls])
-                    therapist_urls = deduplicate_urls(therapist_urls)
 
                 # Find specialty pages (legacy)
                 self._log("Finding specialty pages...")
                 specialty_urls_scored = _find_specialty_pages_legacy(homepage_html, url)
                 specialty_urls = [url for url, score in specialty_urls_scored[:20]]  # Limit to top 20
-                specialty_urls = deduplicate_urls(specialty_urls)
-
-                # Add manual specialty URLs
-                if manual_specialty_urls:
-                    self._log(f"Adding {len(manual_specialty_urls)} manual specialty URL(s)")
-                    specialty_urls.extend([normalize_url(u) for u in manual_specialty_urls])
-                    specialty_urls = deduplicate_urls(specialty_urls)
 
-            self._log(f"Found {len(therapist_urls)} total therapist page(s)")
-            self._log(f"Found {len(specialty_urls)} total specialty page(s)")
-
-            # Scrape therapist pages
-            for therapist_url in therapist_urls:
-                time.sleep(self.rate_limit_delay)
-
-                self._log(f"Scraping therapist page: {therapist_url}")
-                therapist_html = self._load_page(therapist_url)
-
-                if therapist_html:
-                    page_therapists = extract_therapists(therapist_html, therapist_url)
-                    therapists.extend(page_therapists)
-                    self._log(f"Found {len(page_therapists)} therapist(s) on this page")
+            # Add manual URLs if provided, then deduplicate each list in a single pass
+            if manual_about_urls:
+                self._log(f"Adding {len(manual_about_urls)} manual therapist URL(s)")
+                therapist_urls = therapist_urls + [normalize_url(u) for u in manual_about_urls]
 
-            # Add manual specialty URLs
             if manual_specialty_urls:
                 self._log(f"Adding {len(manual_specialty_urls)} manual specialty URL(s)")
-                specialty_urls.extend([normalize_url(u) for u in manual_specialty_urls])
-                specialty_urls = deduplicate_urls(specialty_urls)
+                specialty_urls = specialty_urls + [normalize_url(u) for u in manual_specialty_urls]
 
-            self._log(f"Found {len(specialty_urls)} total specialty page(s)")
+            therapist_urls = deduplicate_urls(therapist_urls)
+            specialty_urls = deduplicate_urls(specialty_urls)
 
-            # Scrape specialty pages
-            for specialty_url in specialty_urls:
-                time.sleep(self.rate_limit_delay)
+            self._log(f"Found {len(therapist_urls)} total therapist page(s)")
+            self._log(f"Found {len(specialty_urls)} total specialty page(s)")
 
-                self._log(f"Scraping specialty page: {specialty_url}")
-                specialty_html = self._load_page(specialty_url)
+            # Pages are fetched concurrently (rate limited) while a process pool parses
+            # them, so CPU-bound extraction overlaps with the network waits
+            with ProcessPoolExecutor(max_workers=self.extraction_workers) as extraction_pool:
+                # Both page sets share one fetch pool, so specialty pages download alongside
+                # the therapist pages instead of waiting for all of them to finish
+                pages = self._load_pages(therapist_urls + specialty_urls, force_refresh, prefetched)
+
+                # Pages whose HTML is identical to one already extracted (the same page under
+                # another URL, e.g. /team and /our-team/) are skipped rather than parsed again
+                seen_therapist_pages = {}
+                seen_specialty_pages = {}
+
+                # Scrape therapist pages
+                therapist_futures = []
+                for therapist_url, therapist_html in islice(pages, len(therapist_urls)):
+                    self._log(f"Scraping therapist page: {therapist_url}")
+
+                    if therapist_html and not self._is_repeat_page(therapist_html, therapist_url, seen_therapist_pages):
+                        therapist_futures.append(
+                            (therapist_url, extraction_pool.submit(extract_therapists, therapist_html, therapist_url))
+                        )
+
+                # Scrape specialty pages
+                specialty_futures = []
+                for specialty_url, specialty_html in pages:
+                    self._log(f"Scraping specialty page: {specialty_url}")
+
+                    if specialty_html and not self._is_repeat_page(specialty_html, specialty_url, seen_specialty_pages):
+                        specialty_futures.append(extraction_pool.submit(extract_specialty, specialty_html, specialty_url))
+
+                # Collect extraction results in page order
+                for therapist_url, future in therapist_futures:
+                    page_therapists = future.result()
+                    therapists.extend(page_therapists)
+                    self._log(f"Found {len(page_therapists)} therapist(s) on {therapist_url}")
 
-                if specialty_html:
-                    specialty = extract_specialty(specialty_html, specialty_url)
+                for future in specialty_futures:
+                    specialty = future.result()
                     if specialty:
                         specialties.append(specialty)
                         self._log(f"Extracted specialty: {specialty.name}")
@@ -198,37 +338,199 @@ class WebsiteScraper:
             errors=errors
         )
 
-    def _load_page(self, url: str) -> Optional[str]:
+    def _is_repeat_page(self, html: str, url: str, seen: Dict[bytes, str]) -> bool:
+        """
+        Check whether a page's HTML is identical to a page already seen under another URL.
+
+        Args:
+            html: Page HTML
+            url: URL the page was loaded from
+            seen: Content hash -> first URL with that content; updated in place
+
+        Returns:
+            True if the page repeats earlier content and can be skipped
+        """
+        digest = hashlib.blake2b(html.encode('utf-8'), digest_size=16).digest()
+        first_url = seen.setdefault(digest, url)
+        if first_url == url:
+            return False
+
+        self._log(f"Skipping {url}: same content as {first_url}")
+        return True
+
+    def _load_pages(
+        self,
+        urls: List[str],
+        force_refresh: bool = False,
+        prefetched: Optional[Dict[str, Optional[str]]] = None
+    ) -> Iterator[Tuple[str, Optional[str]]]:
+        """
+        Load several pages concurrently.
+
+        Args:
+            urls: URLs to load
+            force_refresh: Ignore cached copies of these pages
+            prefetched: Already-loaded pages by URL, returned as-is instead of fetched again
+
+        Returns:
+            Iterator of (url, HTML content or None) pairs, in the same order as urls
+        """
+        prefetched = prefetched or {}
+        to_fetch = [url for url in urls if url not in prefetched]
+        if not to_fetch:
+            for url in urls:
+                yield url, prefetched[url]
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.fetch_workers, len(to_fetch))) as executor:
+            fetched = executor.map(lambda url: self._load_page(url, force_refresh), to_fetch)
+            for url in urls:
+                yield url, prefetched[url] if url in prefetched else next(fetched)
+
+    def _wait_for_host(self, host: str):
+        """Sleep until a host that asked us to back off may be contacted again."""
+        with self._host_lock:
+            resume_at = self._host_resume_at.get(host, 0.0)
+        delay = resume_at - time.time()
+        if delay > 0:
+            time.sleep(delay)
+
+    def _pause_host(self, host: str, delay: float):
+        """Hold back every request to a host for the next delay seconds."""
+        with self._host_lock:
+            resume_at = time.time() + delay
+            if resume_at > self._host_resume_at.get(host, 0.0):
+                self._host_resume_at[host] = resume_at
+
+    def _backoff_delay(self, response: httpx.Response, attempt: int) -> Optional[float]:
+        """
+        Work out how long a host wants us to wait, from a response's status and headers.
+
+        Args:
+            response: Response from the host
+            attempt: Zero-based retry attempt for this page
+
+        Returns:
+            Seconds to pause the host, or None if it isn't signalling any pressure
+        """
+        if response.status_code in RETRY_STATUS_CODES:
+            delay = _parse_retry_after(response.headers.get('Retry-After'))
+            if delay is None:
+                delay = self.rate_limit_delay * 2 ** attempt
+        else:
+            try:
+                remaining = int(response.headers['X-RateLimit-Remaining'])
+            except (KeyError, ValueError):
+                return None
+            if remaining > RATE_LIMIT_MIN_REMAINING:
+                return None
+            delay = _parse_rate_limit_reset(response.headers.get('X-RateLimit-Reset'))
+            if delay is None:
+                delay = self.rate_limit_delay
+
+        return min(delay, MAX_RATE_LIMIT_WAIT)
+
+    def _load_page(self, url: str, force_refresh: bool = False) -> Optional[str]:
         """
         Load a page and return its HTML content using HTTP requests.
 
+        Pages are served from the on-disk cache while fresh, and revalidated with
+        ETag/Last-Modified once stale; a stale copy is also used if the site can't be reached.
+
         Args:
             url: URL to load
+            force_refresh: Discard any cached copy and download the page again
 
         Returns:
             HTML content or None if failed
         """
-        try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-
-            response = requests.get(
-                url,
-                headers=headers,
-                timeout=self.timeout / 1000,  # Convert ms to seconds
-                allow_redirects=True
-            )
-
-            if response.status_code >= 400:
-                self._log(f"Failed to load {url}: status {response.status_code}")
-                return None
+        cached = None
+        if self.cache is not None:
+            if force_refresh:
+                self.cache.delete(url)
+            else:
+                cached = self.cache.get(url)
+                if cached is not None and self.cache.is_fresh(cached):
+                    return self._decode_cached(cached)
 
-            return response.text
+        host = url_netloc(url)
+        try:
+            for attempt in range(MAX_RETRIES + 1):
+                self._wait_for_host(host)
+                with self.client.stream('GET', url, headers=HttpCache.validator_headers(cached)) as response:
+                    delay = self._backoff_delay(response, attempt)
+                    if delay is not None:
+                        self._pause_host(host, delay)
+
+                    if response.status_code in RETRY_STATUS_CODES and attempt < MAX_RETRIES:
+                        continue
+
+                    if response.status_code == 304 and cached is not None:
+                        # Unchanged since it was cached; keep the validators the 304 didn't resend
+                        self._cache_page(
+                            url,
+                            cached['body'],
+                            response.headers.get('ETag') or cached.get('etag'),
+                            response.headers.get('Last-Modified') or cached.get('last_modified'),
+                            cached.get('encoding')
+                        )
+                        return self._decode_cached(cached)
+
+                    if response.status_code >= 400:
+                        self._log(f"Failed to load {url}: status {response.status_code}")
+                        return None
+
+                    # Read at most MAX_PAGE_BYTES of decompressed body, and decode with the
+                    # HTTP charset rather than response.text, which may guess the encoding
+                    body = self._read_capped(response)
+                    encoding = _valid_encoding(response.charset_encoding)
+                    self._cache_page(
+                        url,
+                        body,
+                        response.headers.get('ETag'),
+                        response.headers.get('Last-Modified'),
+                        encoding
+                    )
+                    return body.decode(encoding, errors='replace')
 
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             self._log(f"Timeout loading {url}")
-            return None
-        except requests.exceptions.RequestException as e:
+        except (httpx.HTTPError, httpx.InvalidURL) as e:
             self._log(f"Error loading {url}: {str(e)}")
-            return None
+
+        if cached is not None:
+            self._log(f"Using cached copy of {url}")
+            return self._decode_cached(cached)
+        return None
+
+    @staticmethod
+    def _read_capped(response: httpx.Response) -> bytes:
+        """Read a streamed response's decoded body, stopping after MAX_PAGE_BYTES."""
+        body = bytearray()
+        for chunk in response.iter_bytes():
+            body += chunk
+            if len(body) >= MAX_PAGE_BYTES:
+                break
+        return bytes(body[:MAX_PAGE_BYTES])
+
+    def _cache_page(
+        self,
+        url: str,
+        body: bytes,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        encoding: Optional[str]
+    ):
+        """Store a fetched page in the on-disk cache, if caching is enabled."""
+        if self.cache is None:
+            return
+
+        try:
+            self.cache.set(url, body, etag, last_modified, _valid_encoding(encoding))
+        except OSError as e:
+            logger.warning("Could not write page cache for %s: %s", url, e)
+
+    @staticmethod
+    def _decode_cached(entry: dict) -> str:
+        """Decode a cached page body to HTML text."""
+        return entry['body'].decode(_valid_encoding(entry.get('encoding')), errors='replace')
@@ -1,13 +1,52 @@
 """Google Sheets integration for outputting generated bios."""
 import gspread
-from oauth2client.service_account import ServiceAccountCredentials
+import json
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from gspread.utils import absolute_range_name
+from google.oauth2.service_account import Credentials
 from typing import List, Optional
 from datetime import datetime
+from urllib.parse import urlparse
 import logging
 from ..models.data_models import GeneratedBio
 
 logger = logging.getLogger("bio_generator")
 
+HEADERS = ['Specialty', 'Therapist Name', 'Bio Box (150 words)', 'Source About URL']
+
+# Pixel widths for columns A-D: Specialty, Therapist Name, Bio Box, Source URL
+COLUMN_WIDTHS = [150, 150, 400, 250]
+
+# Rows per values.batchUpdate request, keeping each well under the 10 MB request limit
+ROWS_PER_REQUEST = 5000
+# Concurrent value-upload requests when a sheet needs more than one
+UPLOAD_WORKERS = 4
+
+SCOPE = [
+    'https://spreadsheets.google.com/feeds',
+    'https://www.googleapis.com/auth/drive'
+]
+
+
+@lru_cache(maxsize=4)
+def _get_client(credentials_json: str) -> gspread.Client:
+    """
+    Return a shared authorized client per service account.
+
+    Writers created with the same credentials reuse one client and its OAuth access
+    token, instead of each doing its own token exchange.
+
+    Args:
+        credentials_json: Service account credentials serialized with sorted keys
+
+    Returns:
+        Authorized gspread client
+    """
+    creds = Credentials.from_service_account_info(json.loads(credentials_json), scopes=SCOPE)
+    return gspread.authorize(creds)
+
 
 class SheetsWriter:
     """Writes generated bios to Google Sheets."""
@@ -32,17 +71,7 @@ class SheetsWriter:
             True if successful, False otherwise
         """
         try:
-            scope = [
-                'https://spreadsheets.google.com/feeds',
-                'https://www.googleapis.com/auth/drive'
-            ]
-
-            creds = ServiceAccountCredentials.from_json_keyfile_dict(
-                self.credentials_dict,
-                scope
-            )
-
-            self.client = gspread.authorize(creds)
+            self.client = _get_client(json.dumps(self.credentials_dict, sort_keys=True))
             return True
 
         except Exception as e:
@@ -74,58 +103,15 @@ class SheetsWriter:
         try:
             # Create new spreadsheet
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-            sheet_title = f"Therapist Bios - {website_url.split('//')[1].split('/')[0]} - {timestamp}"
+            host = urlparse(website_url).hostname or 'unknown'
+            sheet_title = f"Therapist Bios - {host} - {timestamp}"
 
             spreadsheet = self.client.create(sheet_title)
 
             # Get the first worksheet
             worksheet = spreadsheet.sheet1
 
-            # Set up headers
-            headers = ['Specialty', 'Therapist Name', 'Bio Box (150 words)', 'Source About URL']
-            worksheet.update('A1:D1', [headers])
-
-            # Format headers
-            worksheet.format('A1:D1', {
-                'textFormat': {'bold': True},
-                'backgroundColor': {'red': 0.9, 'green': 0.9, 'blue': 0.9}
-            })
-
-            # Group bios by specialty
-            bios_by_specialty = {}
-            for bio in bios:
-                if bio.specialty_name not in bios_by_specialty:
-                    bios_by_specialty[bio.specialty_name] = []
-                bios_by_specialty[bio.specialty_name].append(bio)
-
-            # Prepare rows
-            rows = []
-            for specialty_name in sorted(bios_by_specialty.keys()):
-                specialty_bios = bios_by_specialty[specialty_name]
-
-                for bio in specialty_bios:
-                    rows.append([
-                        specialty_name,
-                        bio.therapist_name,
-                        bio.bio_text,
-                        str(bio.source_about_url)
-                    ])
-
-            # Write all rows at once
-            if rows:
-                worksheet.update(f'A2:D{len(rows) + 1}', rows)
-
-                # Format the sheet
-                worksheet.format('A:D', {
-                    'wrapStrategy': 'WRAP',
-                    'verticalAlignment': 'TOP'
-                })
-
-                # Set column widths
-                worksheet.set_column_width('A', 150)  # Specialty
-                worksheet.set_column_width('B', 150)  # Therapist Name
-                worksheet.set_column_width('C', 400)  # Bio Box
-                worksheet.set_column_width('D', 250)  # Source URL
+            self._write_bio_rows(spreadsheet, worksheet, self._build_rows(bios))
 
             # Share with recipient if email provided
             if self.recipient_email:
@@ -170,18 +156,18 @@ class SheetsWriter:
             logger.info("Authentication successful")
 
         try:
-            logger.info(f"Opening spreadsheet: {sheet_url}")
+            logger.info("Opening spreadsheet: %s", sheet_url)
             # Open existing spreadsheet
             spreadsheet = self.client.open_by_url(sheet_url)
-            logger.info(f"Successfully opened spreadsheet: {spreadsheet.title}")
+            logger.info("Successfully opened spreadsheet: %s", spreadsheet.title)
 
             # Get or create worksheet
             if worksheet_name:
                 try:
-                    logger.info(f"Looking for worksheet: {worksheet_name}")
+                    logger.info("Looking for worksheet: %s", worksheet_name)
                     worksheet = spreadsheet.worksheet(worksheet_name)
                 except:
-                    logger.info(f"Worksheet not found, creating: {worksheet_name}")
+                    logger.info("Worksheet not found, creating: %s", worksheet_name)
                     worksheet = spreadsheet.add_worksheet(title=worksheet_name, rows=1000, cols=4)
             else:
                 logger.info("Using first worksheet")
@@ -191,49 +177,9 @@ class SheetsWriter:
             logger.info("Clearing worksheet content...")
             worksheet.clear()
 
-            # Write headers and bios (same as above)
-            logger.info("Writing headers...")
-            headers = ['Specialty', 'Therapist Name', 'Bio Box (150 words)', 'Source About URL']
-            worksheet.update('A1:D1', [headers])
-
-            worksheet.format('A1:D1', {
-                'textFormat': {'bold': True},
-                'backgroundColor': {'red': 0.9, 'green': 0.9, 'blue': 0.9}
-            })
-
-            # Group and write bios
-            bios_by_specialty = {}
-            for bio in bios:
-                if bio.specialty_name not in bios_by_specialty:
-                    bios_by_specialty[bio.specialty_name] = []
-                bios_by_specialty[bio.specialty_name].append(bio)
-
-            rows = []
-            for specialty_name in sorted(bios_by_specialty.keys()):
-                specialty_bios = bios_by_specialty[specialty_name]
-                for bio in specialty_bios:
-                    rows.append([
-                        specialty_name,
-                        bio.therapist_name,
-                        bio.bio_text,
-                        str(bio.source_about_url)
-                    ])
-
-            if rows:
-                logger.info(f"Writing {len(rows)} rows of data...")
-                worksheet.update(f'A2:D{len(rows) + 1}', rows)
-
-                logger.info("Formatting cells...")
-                worksheet.format('A:D', {
-                    'wrapStrategy': 'WRAP',
-                    'verticalAlignment': 'TOP'
-                })
-
-                logger.info("Setting column widths...")
-                worksheet.set_column_width('A', 150)
-                worksheet.set_column_width('B', 150)
-                worksheet.set_column_width('C', 400)
-                worksheet.set_column_width('D', 250)
+            rows = self._build_rows(bios)
+            logger.info("Writing headers and %d rows of data...", len(rows))
+            self._write_bio_rows(spreadsheet, worksheet, rows)
 
             logger.info("Successfully wrote to existing sheet!")
             return True
@@ -243,3 +189,116 @@ class SheetsWriter:
             print(error_msg)
             logger.error(error_msg, exc_info=True)
             return False
+
+    @staticmethod
+    def _build_rows(bios: List[GeneratedBio]) -> List[List[str]]:
+        """
+        Build sheet rows from bios, grouped by specialty in alphabetical order.
+
+        Args:
+            bios: List of generated bios
+
+        Returns:
+            One [specialty, therapist, bio, source URL] row per bio
+        """
+        bios_by_specialty = defaultdict(list)
+        for bio in bios:
+            bios_by_specialty[bio.specialty_name].append(bio)
+
+        return [
+            [specialty_name, bio.therapist_name, bio.bio_text, str(bio.source_about_url)]
+            for specialty_name, specialty_bios in sorted(bios_by_specialty.items())
+            for bio in specialty_bios
+        ]
+
+    @staticmethod
+    def _write_bio_rows(spreadsheet, worksheet, rows: List[List[str]]):
+        """
+        Write the header and bio rows to a worksheet, then format it.
+
+        Cell values go out in values.batchUpdate calls of up to ROWS_PER_REQUEST rows
+        (usually just one, uploaded in parallel when there are more) and all formatting in
+        one spreadsheets.batchUpdate call, instead of a request per range and column.
+
+        Args:
+            spreadsheet: gspread Spreadsheet containing the worksheet
+            worksheet: gspread Worksheet to write to
+            rows: Rows from _build_rows
+        """
+        batches = [[{'range': absolute_range_name(worksheet.title, 'A1:D1'), 'values': [HEADERS]}]]
+        for start in range(0, len(rows), ROWS_PER_REQUEST):
+            chunk = rows[start:start + ROWS_PER_REQUEST]
+            value_range = {
+                'range': absolute_range_name(worksheet.title, f'A{start + 2}:D{start + len(chunk) + 1}'),
+                'values': chunk
+            }
+            # The header rides along with the first chunk
+            if start == 0:
+                batches[0].append(value_range)
+            else:
+                batches.append([value_range])
+
+        def upload(data):
+            return spreadsheet.values_batch_update({'valueInputOption': 'RAW', 'data': data})
+
+        if len(batches) == 1:
+            upload(batches[0])
+        else:
+            # Chunks cover disjoint ranges; the client's connection pool is thread-safe
+            with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as executor:
+                list(executor.map(upload, batches))
+
+        # Header row: bold on a light grey background
+        requests = [{
+            'repeatCell': {
+                'range': {
+                    'sheetId': worksheet.id,
+                    'startRowIndex': 0,
+                    'endRowIndex': 1,
+                    'startColumnIndex': 0,
+                    'endColumnIndex': len(HEADERS)
+                },
+                'cell': {
+                    'userEnteredFormat': {
+                        'textFormat': {'bold': True},
+                        'backgroundColor': {'red': 0.9, 'green': 0.9, 'blue': 0.9}
+                    }
+                },
+                'fields': 'userEnteredFormat(textFormat,backgroundColor)'
+            }
+        }]
+
+        if rows:
+            # Columns A:D: wrap text and align to the top
+            requests.append({
+                'repeatCell': {
+                    'range': {
+                        'sheetId': worksheet.id,
+                        'startColumnIndex': 0,
+                        'endColumnIndex': len(HEADERS)
+                    },
+                    'cell': {
+                        'userEnteredFormat': {
+                            'wrapStrategy': 'WRAP',
+                            'verticalAlignment': 'TOP'
+                        }
+                    },
+                    'fields': 'userEnteredFormat(wrapStrategy,verticalAlignment)'
+                }
+            })
+
+            for column_index, width in enumerate(COLUMN_WIDTHS):
+                requests.append({
+                    'updateDimensionProperties': {
+                        'range': {
+                            'sheetId': worksheet.id,
+                            'dimension': 'COLUMNS',
+                            'startIndex': column_index,
+                            'endIndex': column_index + 1
+                        },
+                        'properties': {'pixelSize': width},
+                        'fields': 'pixelSize'
+                    }
+                })
+
+        spreadsheet.batch_update({'requests': requests})
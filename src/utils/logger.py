@@ -1,13 +1,44 @@
 """Logging utilities for the therapist bio generator."""
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
+from typing import Dict
+
+# Background threads that write queued records to the file and console handlers,
+# one per configured logger name
+_listeners: Dict[str, QueueListener] = {}
+
+
+def _stop_listener(name: str):
+    """Flush queued records, stop a logger's background thread and close its handlers."""
+    listener = _listeners.pop(name, None)
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+def _stop_all_listeners():
+    """Stop every logger's background thread, flushing what is still queued."""
+    for name in list(_listeners):
+        _stop_listener(name)
+
+
+atexit.register(_stop_all_listeners)
 
 
 def setup_logger(name: str = "bio_generator", log_dir: str = "logs") -> logging.Logger:
     """
     Set up a logger that writes to both file and console.
 
+    Records are put on a queue and written by a background listener thread, so logging
+    calls don't block on file or console I/O. Calling this again for the same name
+    (e.g. on a Streamlit rerun) stops that logger's previous listener before starting a
+    new one; listeners for other names keep running.
+
     Args:
         name: Logger name
         log_dir: Directory to store log files
@@ -46,10 +77,14 @@ def setup_logger(name: str = "bio_generator", log_dir: str = "logs") -> logging.
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
 
-    # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Hand records to a queue; the listener thread owns the real handlers
+    _stop_listener(name)
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    _listeners[name] = listener
 
-    logger.info(f"Logging to: {log_file}")
+    logger.info("Logging to: %s", log_file)
 
     return logger
@@ -1,6 +1,6 @@
 """Quick test script to verify improved page detection."""
-import requests
 from src.scraper.content_extractor import extract_therapists
+from src.scraper.website_scraper import WebsiteScraper
 
 # Test with the actual website
 test_url = "https://www.couplestherapistboulder.com/about"
@@ -9,10 +9,14 @@ print(f"Testing extraction from: {test_url}")
 print("=" * 60)
 
 try:
-    response = requests.get(test_url, timeout=10)
-    response.raise_for_status()
+    # Load through the scraper so repeat runs hit its page cache
+    with WebsiteScraper(timeout=10000) as scraper:
+        html = scraper._load_page(test_url)
 
-    therapists = extract_therapists(response.text, test_url)
+    if html is None:
+        raise RuntimeError("Failed to load page")
+
+    therapists = extract_therapists(html, test_url)
 
     print(f"\nFound {len(therapists)} therapist(s):\n")
 